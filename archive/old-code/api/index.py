@@ -34,6 +34,8 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import Optional, List
 
+from src.db.rollups import install_analytics_rollups, rollup_breakdown
+
 # ---------------------------------------------------------------------------
 # DATABASE LAYER (self-contained for serverless)
 # ---------------------------------------------------------------------------
@@ -1156,6 +1158,15 @@ def schedule_blob_save():
         _blob_save_timer.start()
 
 
+def _ensure_rollups(conn):
+    """Install the analytics rollup table and triggers once (backfills on install)."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='analytics_rollups'").fetchone()
+    if not exists:
+        install_analytics_rollups(conn)
+        conn.commit()
+
+
 def init_and_seed():
     db_path = os.environ.get("OCC_DB_PATH", "/tmp/outreach.db")
 
@@ -1179,6 +1190,7 @@ def init_and_seed():
         try:
             rconn = sqlite3.connect(db_path)
             rconn.executescript(SCHEMA_SQL)
+            _ensure_rollups(rconn)
             rconn.close()
             print("Schema migration applied to restored DB")
         except Exception as e:
@@ -1213,6 +1225,8 @@ def init_and_seed():
         except Exception:
             pass  # Column already exists
     conn.commit()
+    # Before the auto-import, so its rows reach the rollups through the triggers
+    _ensure_rollups(conn)
 
     # Auto-import run bundle if DB is empty
     try:
@@ -1298,26 +1312,35 @@ def parse_json_fields(d, fields):
 @app.get("/api/stats")
 def dashboard_stats():
     conn = get_db()
-    total = conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+    # One GROUP BY pass per table instead of a COUNT(*) round trip per metric
     by_stage = {}
     for row in conn.execute("SELECT stage, COUNT(*) as c FROM contacts GROUP BY stage"):
         by_stage[row["stage"]] = row["c"]
-    replies = conn.execute("SELECT COUNT(*) FROM replies").fetchone()[0]
-    meetings = conn.execute("SELECT COUNT(*) FROM opportunities").fetchone()[0]
-    sent = conn.execute("SELECT COUNT(*) FROM touchpoints").fetchone()[0]
-    with_drafts = conn.execute("SELECT COUNT(DISTINCT contact_id) FROM message_drafts").fetchone()[0]
-    total_drafts = conn.execute("SELECT COUNT(*) FROM message_drafts").fetchone()[0]
-
-    # Additional stats for dashboard Quick Stats
-    researched = conn.execute("SELECT COUNT(DISTINCT contact_id) FROM research_snapshots").fetchone()[0]
-    qc_passed = conn.execute("SELECT COUNT(*) FROM message_drafts WHERE qc_passed=1").fetchone()[0]
-    avg_words = conn.execute("SELECT COALESCE(AVG(word_count), 0) FROM message_drafts WHERE word_count > 0").fetchone()[0]
-    wf_completed = conn.execute("SELECT COUNT(*) FROM workflow_runs WHERE status='succeeded'").fetchone()[0]
+    total = sum(by_stage.values())
+
+    counts = conn.execute("""SELECT
+        (SELECT COUNT(*) FROM replies) AS replies,
+        (SELECT COUNT(*) FROM opportunities) AS meetings,
+        (SELECT COUNT(*) FROM touchpoints) AS sent,
+        (SELECT COUNT(DISTINCT contact_id) FROM research_snapshots) AS researched,
+        (SELECT COUNT(*) FROM workflow_runs WHERE status='succeeded') AS wf_completed
+    """).fetchone()
+    replies, meetings, sent = counts["replies"], counts["meetings"], counts["sent"]
+    researched, wf_completed = counts["researched"], counts["wf_completed"]
+
+    drafts = conn.execute("""SELECT COUNT(*) AS total,
+        COUNT(DISTINCT contact_id) AS with_drafts,
+        COALESCE(SUM(CASE WHEN qc_passed=1 THEN 1 ELSE 0 END), 0) AS qc_passed,
+        COALESCE(AVG(CASE WHEN word_count > 0 THEN word_count END), 0) AS avg_words
+        FROM message_drafts""").fetchone()
+    with_drafts, total_drafts = drafts["with_drafts"], drafts["total"]
+    qc_passed, avg_words = drafts["qc_passed"], drafts["avg_words"]
 
     # Draft approval stage counts
     by_approval = {}
     for row in conn.execute("SELECT approval_status, COUNT(*) as c FROM message_drafts GROUP BY approval_status"):
-        by_approval[row["approval_status"] or "draft"] = row["c"]
+        key = row["approval_status"] or "draft"
+        by_approval[key] = by_approval.get(key, 0) + row["c"]
 
     conn.close()
     return {
@@ -1777,79 +1800,30 @@ def list_agent_runs(limit: int = 50):
 
 # ─── INTELLIGENCE ──────────────────────────────────────────────
 
-@app.get("/api/intelligence/proof-points")
-def proof_point_stats():
+def _rollup_usage(dimension: str) -> dict:
+    """Touches ("used") and replies per value of one analytics rollup dimension."""
     conn = get_db()
-    results = {}
-    for row in conn.execute("""
-        SELECT m.proof_point_used, COUNT(*) as used,
-               COUNT(DISTINCT r.id) as replied
-        FROM message_drafts m
-        LEFT JOIN replies r ON m.contact_id = r.contact_id
-        WHERE m.proof_point_used IS NOT NULL
-        GROUP BY m.proof_point_used
-    """):
-        d = dict(row)
-        pp = d["proof_point_used"]
-        results[pp] = {"used": d["used"], "replied": d["replied"],
-                       "rate": round(d["replied"]/max(d["used"],1)*100, 1)}
+    rows = rollup_breakdown(conn, dimension)
     conn.close()
-    return results
+    return {r["value"]: {"used": r["touches"], "replied": r["replies"],
+                         "rate": round(r["replies"]/max(r["touches"],1)*100, 1)}
+            for r in rows if r["value"] and (r["touches"] or r["replies"])}
+
+@app.get("/api/intelligence/proof-points")
+def proof_point_stats():
+    return _rollup_usage("proof_point")
 
 @app.get("/api/intelligence/pain-hooks")
 def pain_hook_stats():
-    conn = get_db()
-    results = {}
-    for row in conn.execute("""
-        SELECT m.pain_hook, COUNT(*) as used,
-               COUNT(DISTINCT r.id) as replied
-        FROM message_drafts m
-        LEFT JOIN replies r ON m.contact_id = r.contact_id
-        WHERE m.pain_hook IS NOT NULL
-        GROUP BY m.pain_hook
-    """):
-        d = dict(row)
-        results[d["pain_hook"]] = {"used": d["used"], "replied": d["replied"],
-                                    "rate": round(d["replied"]/max(d["used"],1)*100, 1)}
-    conn.close()
-    return results
+    return _rollup_usage("pain_hook")
 
 @app.get("/api/intelligence/opener-styles")
 def opener_style_stats():
-    conn = get_db()
-    results = {}
-    for row in conn.execute("""
-        SELECT m.opener_style, COUNT(*) as used,
-               COUNT(DISTINCT r.id) as replied
-        FROM message_drafts m
-        LEFT JOIN replies r ON m.contact_id = r.contact_id
-        WHERE m.opener_style IS NOT NULL
-        GROUP BY m.opener_style
-    """):
-        d = dict(row)
-        results[d["opener_style"]] = {"used": d["used"], "replied": d["replied"],
-                                       "rate": round(d["replied"]/max(d["used"],1)*100, 1)}
-    conn.close()
-    return results
+    return _rollup_usage("opener_style")
 
 @app.get("/api/intelligence/personalization")
 def personalization_stats():
-    conn = get_db()
-    results = {}
-    for row in conn.execute("""
-        SELECT m.personalization_score, COUNT(*) as used,
-               COUNT(DISTINCT r.id) as replied
-        FROM message_drafts m
-        LEFT JOIN replies r ON m.contact_id = r.contact_id
-        WHERE m.personalization_score IS NOT NULL
-        GROUP BY m.personalization_score
-    """):
-        d = dict(row)
-        results[str(d["personalization_score"])] = {
-            "used": d["used"], "replied": d["replied"],
-            "rate": round(d["replied"]/max(d["used"],1)*100, 1)}
-    conn.close()
-    return results
+    return _rollup_usage("personalization_score")
 
 # ─── FOLLOWUPS ─────────────────────────────────────────────────
 
@@ -2674,18 +2648,19 @@ def import_contacts(data: dict):
     try:
         conn = get_db()
         contacts = data.get("contacts", [])
-        results = []
         now = datetime.utcnow().isoformat()
 
-        for contact in contacts:
-            cid = gen_id("con")
-            conn.execute("""INSERT INTO contacts (id,account_id,first_name,last_name,email,
-                linkedin_url,stage,status,created_at,updated_at)
-                VALUES (?,?,?,?,?,?,?,?,?,?)""",
-                (cid, contact.get("account_id"), contact.get("first_name",""),
-                 contact.get("last_name",""), contact.get("email",""),
-                 contact.get("linkedin_url",""), "new", "active", now, now))
-            results.append(cid)
+        rows = [
+            (gen_id("con"), contact.get("account_id"), contact.get("first_name",""),
+             contact.get("last_name",""), contact.get("email",""),
+             contact.get("linkedin_url",""), "new", "active", now, now)
+            for contact in contacts
+        ]
+        # One executemany in a single transaction instead of a statement per contact
+        conn.executemany("""INSERT INTO contacts (id,account_id,first_name,last_name,email,
+            linkedin_url,stage,status,created_at,updated_at)
+            VALUES (?,?,?,?,?,?,?,?,?,?)""", rows)
+        results = [r[0] for r in rows]
 
         conn.commit()
         conn.close()
@@ -2788,82 +2763,30 @@ def pipeline_run_stream(run_id: str):
 # ─── ANALYTICS ENDPOINTS (Intelligence, Experiments, Signals, etc.) ────────────
 @app.get("/api/analytics/reply-rates")
 def analytics_reply_rates():
-    """Reply rates broken down by persona, vertical, proof point, and personalization score."""
-    conn = get_db()
-
-    # By persona
-    by_persona = []
-    persona_rows = conn.execute("""
-        SELECT c.persona_type, COUNT(DISTINCT c.id) as total,
-               COUNT(DISTINCT r.id) as replies
-        FROM contacts c
-        LEFT JOIN touchpoints tp ON c.id = tp.contact_id
-        LEFT JOIN replies r ON c.id = r.contact_id
-        WHERE c.status = 'active'
-        GROUP BY c.persona_type
-    """).fetchall()
-    for row in persona_rows:
-        persona = row["persona_type"] or "unknown"
-        total = row["total"] or 0
-        replies = row["replies"] or 0
-        rate = (replies / total * 100) if total > 0 else 0
-        by_persona.append({"persona": persona, "total": total, "replies": replies, "rate": round(rate, 1)})
+    """Reply rates broken down by persona, vertical, proof point, and personalization score.
 
-    # By vertical (from accounts)
-    by_vertical = []
-    vert_rows = conn.execute("""
-        SELECT a.industry, COUNT(DISTINCT c.id) as total,
-               COUNT(DISTINCT r.id) as replies
-        FROM accounts a
-        LEFT JOIN contacts c ON a.id = c.account_id
-        LEFT JOIN touchpoints tp ON c.id = tp.contact_id
-        LEFT JOIN replies r ON c.id = r.contact_id
-        WHERE c.status = 'active'
-        GROUP BY a.industry
-    """).fetchall()
-    for row in vert_rows:
-        vertical = row["industry"] or "unknown"
-        total = row["total"] or 0
-        replies = row["replies"] or 0
-        rate = (replies / total * 100) if total > 0 else 0
-        by_vertical.append({"vertical": vertical, "total": total, "replies": replies, "rate": round(rate, 1)})
+    Read from the analytics rollups: total is touches sent, replies is replies received.
+    """
+    conn = get_db()
+    breakdowns = {dim: [r for r in rollup_breakdown(conn, dim) if r["touches"] or r["replies"]]
+                  for dim in ("persona", "vertical", "proof_point", "personalization_score")}
+    conn.close()
 
-    # By proof point
-    by_proof_point = []
-    proof_rows = conn.execute("""
-        SELECT md.proof_point_used, COUNT(DISTINCT md.id) as total,
-               COUNT(DISTINCT r.id) as replies
-        FROM message_drafts md
-        LEFT JOIN replies r ON md.contact_id = r.contact_id
-        WHERE md.proof_point_used IS NOT NULL
-        GROUP BY md.proof_point_used
-    """).fetchall()
-    for row in proof_rows:
-        proof = row["proof_point_used"] or "unknown"
-        total = row["total"] or 0
-        replies = row["replies"] or 0
+    def _rate_row(label, value, r):
+        total = r["touches"]
+        replies = r["replies"]
         rate = (replies / total * 100) if total > 0 else 0
-        by_proof_point.append({"proof_point": proof, "total": total, "replies": replies, "rate": round(rate, 1)})
+        return {label: value, "total": total, "replies": replies, "rate": round(rate, 1)}
 
-    # By personalization score
-    by_personalization = []
-    pscore_rows = conn.execute("""
-        SELECT md.personalization_score, COUNT(DISTINCT md.id) as total,
-               COUNT(DISTINCT r.id) as replies
-        FROM message_drafts md
-        LEFT JOIN replies r ON md.contact_id = r.contact_id
-        WHERE md.personalization_score IS NOT NULL
-        GROUP BY md.personalization_score
-        ORDER BY md.personalization_score
-    """).fetchall()
-    for row in pscore_rows:
-        score = row["personalization_score"] or 1
-        total = row["total"] or 0
-        replies = row["replies"] or 0
-        rate = (replies / total * 100) if total > 0 else 0
-        by_personalization.append({"score": score, "total": total, "replies": replies, "rate": round(rate, 1)})
+    by_persona = [_rate_row("persona", r["value"] or "unknown", r) for r in breakdowns["persona"]]
+    by_vertical = [_rate_row("vertical", r["value"] or "unknown", r) for r in breakdowns["vertical"]]
+    by_proof_point = [_rate_row("proof_point", r["value"], r)
+                      for r in breakdowns["proof_point"] if r["value"]]
+    by_personalization = sorted(
+        (_rate_row("score", int(r["value"]), r)
+         for r in breakdowns["personalization_score"] if r["value"].isdigit()),
+        key=lambda row: row["score"])
 
-    conn.close()
     return {
         "by_persona": by_persona,
         "by_vertical": by_vertical,
@@ -10978,58 +10901,48 @@ def get_command_center_stats():
     """Get comprehensive Command Center statistics."""
     conn = get_db()
     try:
-        # Prospects
-        total_prospects = conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
-        prospects_with_research = conn.execute("""
-            SELECT COUNT(DISTINCT contact_id) FROM research_snapshots
-        """).fetchone()[0]
-        prospects_with_drafts = conn.execute("""
-            SELECT COUNT(DISTINCT contact_id) FROM message_drafts
-        """).fetchone()[0]
-
-        # LinkedIn drafts
-        linkedin_total = conn.execute("""
-            SELECT COUNT(*) FROM message_drafts WHERE channel='linkedin'
-        """).fetchone()[0]
-
-        # LinkedIn by stage
-        linkedin_by_stage = {}
+        # Scalar counts across tables in one round trip
+        counts = conn.execute("""SELECT
+            (SELECT COUNT(*) FROM contacts) AS total_prospects,
+            (SELECT COUNT(DISTINCT contact_id) FROM research_snapshots) AS with_research,
+            (SELECT COUNT(DISTINCT contact_id) FROM message_drafts) AS with_drafts,
+            (SELECT COUNT(*) FROM outreach_touches) AS total_sent,
+            (SELECT COUNT(*) FROM outreach_responses) AS total_replied,
+            (SELECT COUNT(*) FROM workflow_runs) AS total_workflow_runs,
+            (SELECT COUNT(*) FROM workflow_runs WHERE status='failed') AS failed_runs
+        """).fetchone()
+        total_prospects = counts["total_prospects"]
+        prospects_with_research = counts["with_research"]
+        prospects_with_drafts = counts["with_drafts"]
+        total_sent = counts["total_sent"]
+        total_replied = counts["total_replied"]
+
+        # Drafts: a single GROUP BY pass yields per-channel stage counts and
+        # the pipeline totals
+        by_channel = {"linkedin": {}, "email": {}}
+        total_enhanced = total_approved = 0
         for row in conn.execute("""
-            SELECT approval_status, COUNT(*) as cnt FROM message_drafts
-            WHERE channel='linkedin' GROUP BY approval_status
+            SELECT channel, approval_status, COUNT(*) as cnt FROM message_drafts
+            GROUP BY channel, approval_status
         """):
-            linkedin_by_stage[row["approval_status"] or "draft"] = row["cnt"]
+            status = row["approval_status"]
+            if status == "enhanced":
+                total_enhanced += row["cnt"]
+            elif status == "approved":
+                total_approved += row["cnt"]
+            if row["channel"] in by_channel:
+                stages = by_channel[row["channel"]]
+                key = status or "draft"
+                stages[key] = stages.get(key, 0) + row["cnt"]
+
+        linkedin_by_stage = by_channel["linkedin"]
+        linkedin_total = sum(linkedin_by_stage.values())
+        email_by_stage = by_channel["email"]
+        email_total = sum(email_by_stage.values())
 
         # LinkedIn ready to send (approved + queued)
         linkedin_ready = linkedin_by_stage.get("approved", 0) + linkedin_by_stage.get("queued", 0)
 
-        # Email drafts
-        email_total = conn.execute("""
-            SELECT COUNT(*) FROM message_drafts WHERE channel='email'
-        """).fetchone()[0]
-
-        # Email by stage
-        email_by_stage = {}
-        for row in conn.execute("""
-            SELECT approval_status, COUNT(*) as cnt FROM message_drafts
-            WHERE channel='email' GROUP BY approval_status
-        """):
-            email_by_stage[row["approval_status"] or "draft"] = row["cnt"]
-
-        # Pipeline stats
-        total_enhanced = conn.execute("""
-            SELECT COUNT(*) FROM message_drafts WHERE approval_status='enhanced'
-        """).fetchone()[0]
-        total_approved = conn.execute("""
-            SELECT COUNT(*) FROM message_drafts WHERE approval_status='approved'
-        """).fetchone()[0]
-        total_sent = conn.execute("""
-            SELECT COUNT(*) FROM outreach_touches
-        """).fetchone()[0]
-        total_replied = conn.execute("""
-            SELECT COUNT(*) FROM outreach_responses
-        """).fetchone()[0]
-
         # Workflow runs
         recent_runs = []
         for row in conn.execute("""
@@ -11043,10 +10956,8 @@ def get_command_center_stats():
                 "created_at": row["created_at"]
             })
 
-        total_workflow_runs = conn.execute("SELECT COUNT(*) FROM workflow_runs").fetchone()[0]
-        failed_runs = conn.execute("""
-            SELECT COUNT(*) FROM workflow_runs WHERE status='failed'
-        """).fetchone()[0]
+        total_workflow_runs = counts["total_workflow_runs"]
+        failed_runs = counts["failed_runs"]
 
         return {
             "prospects": {
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Conversion Stats Benchmark - Times feedback_tracker.get_conversion_stats on a synthetic database.
+
+Builds a throwaway database with N touchpoints spread over the last 60 days
+(a reply on every Kth touch, a meeting on every Mth reply), then times three
+variants:
+
+    [before]  legacy: every touchpoint/reply in the window loaded as dicts
+              and bucketed six times in Python
+    [live]    grouped SQL over the source tables (no rollup table)
+    [rollup]  grouped SQL over the trigger-maintained analytics_rollups
+
+Results of all three are compared to make sure the output is identical.
+
+Usage:
+    python scripts/bench_conversion_stats.py                     # 100k touchpoints
+    python scripts/bench_conversion_stats.py --touchpoints 20000 --runs 5
+"""
+
+import sys
+import os
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+PERSONAS = ["qa_leader", "vp_eng", "cto", "test_architect", "dev_manager"]
+PROOF_POINTS = ["hansard", "medibuddy", "cred", "sanofi", "nagra", "fortune100"]
+OPENERS = ["career_reference", "company_news", "peer_proof", "question"]
+CHANNELS = ["linkedin", "email", "phone"]
+INTENTS = ["positive", "neutral", "negative", "referral", "out_of_office"]
+
+
+def legacy_conversion_stats(models, feedback_tracker, days: int) -> dict:
+    """The pre-rollup implementation: materialise the window, bucket in Python."""
+    conn = models.get_db()
+    cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
+    touchpoints = [dict(r) for r in conn.execute("""
+        SELECT t.*, md.proof_point_used, md.pain_hook, md.opener_style,
+               md.ask_style, md.ab_group, md.ab_variable,
+               md.personalization_score, md.touch_type
+        FROM touchpoints t
+        LEFT JOIN message_drafts md ON t.message_draft_id = md.id
+        WHERE t.sent_at >= ?
+    """, (cutoff,)).fetchall()]
+    replies = [dict(r) for r in conn.execute("""
+        SELECT r.*, t.contact_id as tp_contact_id
+        FROM replies r
+        LEFT JOIN touchpoints t ON r.touchpoint_id = t.id
+        WHERE r.replied_at >= ?
+    """, (cutoff,)).fetchall()]
+    meetings = [dict(r) for r in conn.execute(
+        "SELECT * FROM opportunities WHERE created_at >= ?", (cutoff,)).fetchall()]
+    conn.close()
+
+    reply_by_tp = {r["touchpoint_id"]: r for r in replies if r.get("touchpoint_id")}
+    positive = len([r for r in replies if r.get("intent") in ("positive", "referral")])
+    breakdown, safe_rate = feedback_tracker._breakdown, feedback_tracker._safe_rate
+    return {
+        "by_proof_point": breakdown(touchpoints, reply_by_tp, "proof_point_used"),
+        "by_channel": breakdown(touchpoints, reply_by_tp, "channel"),
+        "by_touch_number": breakdown(touchpoints, reply_by_tp, "touch_number"),
+        "by_opener_style": breakdown(touchpoints, reply_by_tp, "opener_style"),
+        "by_ab_group": breakdown(touchpoints, reply_by_tp, "ab_group"),
+        "by_subject_style": breakdown(touchpoints, reply_by_tp, "subject_line_style"),
+        "totals": {
+            "touches_sent": len(touchpoints),
+            "replies_received": len(replies),
+            "positive_replies": positive,
+            "meetings_booked": len(meetings),
+            "reply_rate": safe_rate(len(replies), len(touchpoints)),
+            "positive_rate": safe_rate(positive, len(touchpoints)),
+            "meeting_rate": safe_rate(len(meetings), len(touchpoints)),
+        },
+        "period_days": days,
+    }
+
+
+def build_synthetic_db(db_path: str, touchpoints: int, reply_every: int, meeting_every: int) -> dict:
+    """Populate the database directly with executemany; returns row counts.
+
+    Each touchpoint gets its own draft and at most one reply, and timestamps
+    stay inside the window, so the legacy and rollup definitions agree exactly.
+    """
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA synchronous=OFF")
+
+    contacts = max(touchpoints // 5, 1)
+    conn.executemany("INSERT INTO contacts (id, first_name, last_name, persona_type) VALUES (?,?,?,?)",
+                     [(f"con_{i}", "F", "L", rng.choice(PERSONAS)) for i in range(contacts)])
+
+    draft_rows, touch_rows, reply_rows, opp_rows = [], [], [], []
+    for i in range(touchpoints):
+        cid = f"con_{i % contacts}"
+        channel = rng.choice(CHANNELS)
+        sent = (now - timedelta(days=rng.randint(1, 60), minutes=rng.randint(0, 600))).isoformat()
+        draft_rows.append((f"md_{i}", cid, channel, "inmail", "body", rng.choice(PROOF_POINTS),
+                           rng.choice(OPENERS), rng.choice("AB")))
+        touch_rows.append((f"tp_{i}", cid, f"md_{i}", channel, i % 6 + 1, sent))
+        if i % reply_every == 0:
+            reply_rows.append((f"rep_{i}", cid, f"tp_{i}", channel, rng.choice(INTENTS), sent))
+            if len(reply_rows) % meeting_every == 0:
+                opp_rows.append((f"opp_{i}", cid, f"tp_{i}", sent))
+
+    conn.executemany("INSERT INTO message_drafts (id, contact_id, channel, touch_type, body, "
+                     "proof_point_used, opener_style, ab_group) VALUES (?,?,?,?,?,?,?,?)", draft_rows)
+    conn.executemany("INSERT INTO touchpoints (id, contact_id, message_draft_id, channel, touch_number, sent_at) "
+                     "VALUES (?,?,?,?,?,?)", touch_rows)
+    conn.executemany("INSERT INTO replies (id, contact_id, touchpoint_id, channel, intent, replied_at) "
+                     "VALUES (?,?,?,?,?,?)", reply_rows)
+    conn.executemany("INSERT INTO opportunities (id, contact_id, trigger_touchpoint_id, created_at) "
+                     "VALUES (?,?,?,?)", opp_rows)
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+    return {"touchpoints": len(touch_rows), "replies": len(reply_rows), "meetings": len(opp_rows)}
+
+
+def _time(fn, runs: int) -> tuple:
+    timings = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark get_conversion_stats on a synthetic DB")
+    parser.add_argument("--touchpoints", type=int, default=100000)
+    parser.add_argument("--reply-every", type=int, default=8, help="One reply per N touchpoints")
+    parser.add_argument("--meeting-every", type=int, default=5, help="One meeting per N replies")
+    parser.add_argument("--days", type=int, default=90, help="Look-back window")
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs per variant (best is reported)")
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="occ_bench_")
+    db_path = os.path.join(tmpdir, "bench.db")
+    os.environ["OCC_DB_PATH"] = db_path
+
+    from src.db.init_db import init_db
+    from src.db import models
+    from src.db.rollups import install_analytics_rollups
+    from src.agents import feedback_tracker
+
+    models.DB_PATH = db_path
+    init_db(db_path)
+
+    print("Building synthetic database...")
+    start = time.perf_counter()
+    counts = build_synthetic_db(db_path, args.touchpoints, args.reply_every, args.meeting_every)
+    print(f"  {counts} in {time.perf_counter() - start:.1f}s")
+
+    print("=" * 50)
+    print(f"CONVERSION STATS BENCHMARK (best of {args.runs}, {args.days}-day window)")
+    print("=" * 50)
+
+    before, legacy = _time(lambda: legacy_conversion_stats(models, feedback_tracker, args.days), args.runs)
+    print(f"  [before] Python buckets      {before * 1000:>10,.0f} ms")
+
+    live, live_stats = _time(lambda: feedback_tracker.get_conversion_stats(args.days), args.runs)
+    print(f"  [live]   grouped SQL         {live * 1000:>10,.0f} ms")
+
+    conn = sqlite3.connect(db_path)
+    start = time.perf_counter()
+    install_analytics_rollups(conn)
+    conn.commit()
+    conn.close()
+    print(f"  (rollup install + backfill   {(time.perf_counter() - start) * 1000:>10,.0f} ms)")
+
+    after, rollup_stats = _time(lambda: feedback_tracker.get_conversion_stats(args.days), args.runs)
+    print(f"  [rollup] analytics_rollups   {after * 1000:>10,.0f} ms")
+
+    same = legacy == live_stats == rollup_stats
+    print()
+    print(f"Speedup (live):   {before / live:.1f}x")
+    print(f"Speedup (rollup): {before / after:.1f}x")
+    print(f"Results identical: {same}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+DB Pool Benchmark - Compares CRUD throughput with and without connection pooling.
+
+Runs create_contact / get_contact / update_contact against a throwaway database,
+first with the connection pool disabled (one sqlite3.connect + PRAGMAs per call,
+the pre-pool behaviour) and then with it enabled, and prints ops/sec for each.
+
+Usage:
+    python scripts/bench_db_pool.py              # 2000 ops per operation
+    python scripts/bench_db_pool.py --ops 5000
+    python scripts/bench_db_pool.py --journal-mode DELETE
+"""
+
+import sys
+import os
+import argparse
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+def _time_ops(label: str, fn, ops: int) -> float:
+    start = time.perf_counter()
+    for i in range(ops):
+        fn(i)
+    elapsed = time.perf_counter() - start
+    rate = ops / elapsed if elapsed > 0 else float("inf")
+    print(f"  {label:<16} {rate:>10,.0f} ops/sec  ({elapsed * 1000:.0f} ms)")
+    return rate
+
+
+def run_round(models, account_id: str, ops: int) -> dict:
+    contact_ids = []
+
+    def create(i):
+        c = models.create_contact({
+            "account_id": account_id,
+            "first_name": f"Bench{i}",
+            "last_name": "User",
+            "title": "QA Manager",
+        })
+        contact_ids.append(c["id"])
+
+    def get(i):
+        models.get_contact(contact_ids[i % len(contact_ids)])
+
+    def update(i):
+        models.update_contact(contact_ids[i % len(contact_ids)], {"stage": "touched"})
+
+    return {
+        "create_contact": _time_ops("create_contact", create, ops),
+        "get_contact": _time_ops("get_contact", get, ops),
+        "update_contact": _time_ops("update_contact", update, ops),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs unpooled DB access")
+    parser.add_argument("--ops", type=int, default=2000, help="Operations per CRUD call type")
+    parser.add_argument("--journal-mode", default="WAL", choices=["WAL", "DELETE"])
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="occ_bench_")
+    db_path = os.path.join(tmpdir, "bench.db")
+    os.environ["OCC_DB_PATH"] = db_path
+    os.environ["OCC_JOURNAL_MODE"] = args.journal_mode
+
+    from src.db.init_db import init_db
+    from src.db.migrate_v2 import run_migration as run_v2_migration
+    from src.db.migrate_v3 import run_migration as run_v3_migration
+    from src.db import models
+    from src.db.connection import pool
+
+    models.DB_PATH = db_path
+    init_db(db_path)
+    run_v2_migration(db_path)
+    run_v3_migration(db_path)
+
+    account = models.create_account({"name": "Bench Corp", "industry": "SaaS"})
+
+    print("=" * 50)
+    print(f"DB POOL BENCHMARK ({args.ops} ops, journal_mode={args.journal_mode})")
+    print("=" * 50)
+
+    pool.enabled = False
+    print("[before] connect-per-call")
+    before = run_round(models, account["id"], args.ops)
+
+    pool.enabled = True
+    print("[after] pooled")
+    after = run_round(models, account["id"], args.ops)
+    pool.close_all()
+
+    print()
+    print("Speedup:")
+    for op in before:
+        print(f"  {op:<16} {after[op] / before[op]:.2f}x")
+    print(f"Pool stats: {pool.stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Intelligence Benchmark - Times /api/intelligence on a synthetic database.
+
+Builds a throwaway database with N contacts, each with T touchpoints and R
+replies, then times the endpoint twice: once with the legacy
+contacts x touchpoints x replies LEFT JOIN + COUNT(DISTINCT) queries, and once
+with the pre-aggregated rollups in models.get_intelligence_data. Both results
+are compared to make sure the rewrite returns the same numbers.
+
+Usage:
+    python scripts/bench_intelligence.py                    # 50k contacts, 20 touches, 3 replies
+    python scripts/bench_intelligence.py --contacts 5000
+    python scripts/bench_intelligence.py --touches 10 --replies 2 --runs 5
+"""
+
+import sys
+import os
+import argparse
+import random
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+PERSONAS = ["qa_leader", "vp_eng", "cto", "test_architect", "dev_manager"]
+VERTICALS = ["SaaS", "FinTech", "Healthcare", "Retail", "Gaming", "Telecom"]
+PROOF_POINTS = ["hansard", "medibuddy", "cred", "sanofi", "nagra", "fortune100"]
+
+
+def legacy_intelligence_data(models) -> dict:
+    """The pre-rollup implementation: fan-out LEFT JOINs undone by COUNT(DISTINCT)."""
+    conn = models.get_db()
+    intelligence = {}
+    queries = {
+        "by_persona": ("persona", "persona_type", """
+            SELECT c.persona_type, COUNT(DISTINCT tp.id) as touches, COUNT(DISTINCT r.id) as replies
+            FROM contacts c
+            LEFT JOIN touchpoints tp ON tp.contact_id = c.id
+            LEFT JOIN replies r ON r.contact_id = c.id
+            WHERE c.persona_type IS NOT NULL GROUP BY c.persona_type"""),
+        "by_vertical": ("vertical", "industry", """
+            SELECT a.industry, COUNT(DISTINCT tp.id) as touches, COUNT(DISTINCT r.id) as replies
+            FROM contacts c
+            LEFT JOIN accounts a ON c.account_id = a.id
+            LEFT JOIN touchpoints tp ON tp.contact_id = c.id
+            LEFT JOIN replies r ON r.contact_id = c.id
+            WHERE a.industry IS NOT NULL GROUP BY a.industry"""),
+        "by_proof_point": ("proof_point", "proof_point_used", """
+            SELECT md.proof_point_used, COUNT(DISTINCT tp.id) as touches, COUNT(DISTINCT r.id) as replies
+            FROM message_drafts md
+            LEFT JOIN touchpoints tp ON tp.message_draft_id = md.id
+            LEFT JOIN replies r ON r.touchpoint_id = tp.id
+            WHERE md.proof_point_used IS NOT NULL GROUP BY md.proof_point_used"""),
+        "by_personalization": ("score", "personalization_score", """
+            SELECT md.personalization_score, COUNT(DISTINCT tp.id) as touches, COUNT(DISTINCT r.id) as replies
+            FROM message_drafts md
+            LEFT JOIN touchpoints tp ON tp.message_draft_id = md.id
+            LEFT JOIN replies r ON r.touchpoint_id = tp.id
+            WHERE md.personalization_score IS NOT NULL GROUP BY md.personalization_score"""),
+    }
+    for key, (label, column, sql) in queries.items():
+        intelligence[key] = [
+            {label: r[column], "touches": r["touches"], "replies": r["replies"],
+             "rate": round(r["replies"] / max(r["touches"], 1) * 100, 1)}
+            for r in conn.execute(sql).fetchall()
+        ]
+    conn.close()
+    return intelligence
+
+
+def build_synthetic_db(db_path: str, contacts: int, touches: int, replies: int):
+    """Populate the database directly with executemany; returns row counts."""
+    import sqlite3
+
+    rng = random.Random(42)
+    now = "2026-01-01T00:00:00"
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA synchronous=OFF")
+
+    accounts = [(f"acc_{i}", f"Account {i}", VERTICALS[i % len(VERTICALS)]) for i in range(max(contacts // 10, 1))]
+    conn.executemany("INSERT INTO accounts (id, name, industry) VALUES (?,?,?)", accounts)
+
+    contact_rows, draft_rows, touch_rows, reply_rows = [], [], [], []
+    for i in range(contacts):
+        cid = f"con_{i}"
+        contact_rows.append((cid, accounts[i % len(accounts)][0], "F", "L", rng.choice(PERSONAS)))
+        # One draft per touch so proof point / personalization groups see fan-out too
+        for t in range(touches):
+            did = f"md_{i}_{t}"
+            draft_rows.append((did, cid, "linkedin", "inmail", "body",
+                               rng.choice(PROOF_POINTS), rng.randint(1, 3)))
+            touch_rows.append((f"tp_{i}_{t}", cid, did, "linkedin", t + 1, now))
+        for r in range(min(replies, touches)):
+            reply_rows.append((f"rep_{i}_{r}", cid, f"tp_{i}_{r}", "linkedin", "positive"))
+
+    conn.executemany("INSERT INTO contacts (id, account_id, first_name, last_name, persona_type) "
+                     "VALUES (?,?,?,?,?)", contact_rows)
+    conn.executemany("INSERT INTO message_drafts (id, contact_id, channel, touch_type, body, "
+                     "proof_point_used, personalization_score) VALUES (?,?,?,?,?,?,?)", draft_rows)
+    conn.executemany("INSERT INTO touchpoints (id, contact_id, message_draft_id, channel, touch_number, sent_at) "
+                     "VALUES (?,?,?,?,?,?)", touch_rows)
+    conn.executemany("INSERT INTO replies (id, contact_id, touchpoint_id, channel, intent) "
+                     "VALUES (?,?,?,?,?)", reply_rows)
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+    return {"contacts": len(contact_rows), "touchpoints": len(touch_rows), "replies": len(reply_rows)}
+
+
+def _time_endpoint(fetch, runs: int) -> tuple:
+    timings = []
+    body = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        body = fetch()
+        timings.append(time.perf_counter() - start)
+    return min(timings), body
+
+
+def _endpoint_fetcher(models):
+    """GET /api/intelligence through the app, or call the handler's model function without fastapi."""
+    try:
+        from fastapi.testclient import TestClient
+    except ImportError:
+        print("  fastapi not installed; timing models.get_intelligence_data() directly")
+        return lambda: models.get_intelligence_data()
+
+    from src.api.app import app
+    client = TestClient(app)
+
+    def fetch():
+        resp = client.get("/api/intelligence")
+        resp.raise_for_status()
+        return resp.json()
+    return fetch
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark /api/intelligence on a synthetic DB")
+    parser.add_argument("--contacts", type=int, default=50000)
+    parser.add_argument("--touches", type=int, default=20, help="Touchpoints per contact")
+    parser.add_argument("--replies", type=int, default=3, help="Replies per contact")
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs per variant (best is reported)")
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="occ_bench_")
+    db_path = os.path.join(tmpdir, "bench.db")
+    os.environ["OCC_DB_PATH"] = db_path
+
+    from src.db.init_db import init_db
+    from src.db.migrate_v2 import run_migration as run_v2_migration
+    from src.db.migrate_v3 import run_migration as run_v3_migration
+    from src.db import models
+
+    models.DB_PATH = db_path
+    init_db(db_path)
+    run_v2_migration(db_path)
+    run_v3_migration(db_path)
+
+    print("Building synthetic database...")
+    start = time.perf_counter()
+    counts = build_synthetic_db(db_path, args.contacts, args.touches, args.replies)
+    print(f"  {counts} in {time.perf_counter() - start:.1f}s")
+
+    fetch = _endpoint_fetcher(models)
+
+    print("=" * 50)
+    print(f"INTELLIGENCE BENCHMARK (best of {args.runs})")
+    print("=" * 50)
+
+    rollup_fn = models.get_intelligence_data
+    models.get_intelligence_data = lambda: legacy_intelligence_data(models)
+    try:
+        before, legacy_body = _time_endpoint(fetch, args.runs)
+    finally:
+        models.get_intelligence_data = rollup_fn
+    print(f"  [before] fan-out join       {before * 1000:>10,.0f} ms")
+
+    after, body = _time_endpoint(fetch, args.runs)
+    print(f"  [after]  pre-aggregated CTE {after * 1000:>10,.0f} ms")
+
+    key = lambda rows: sorted(rows, key=lambda r: str(list(r.values())[0]))
+    same = all(key(legacy_body[k]) == key(body[k]) for k in legacy_body)
+    print()
+    print(f"Speedup: {before / after:.1f}x")
+    print(f"Results identical: {same}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Rebuild Analytics Rollups - Recompute analytics_rollups from the source tables.
+
+The rollup triggers only see new touchpoints, replies and opportunities. Run
+this after backfilling or importing data, or after editing/deleting source
+rows, so the daily buckets match the raw tables again. Installs the table and
+triggers first if migration 005 has not been applied.
+
+Usage:
+    python scripts/rebuild_rollups.py                 # Rebuild the configured DB
+    python scripts/rebuild_rollups.py --db path.db    # Rebuild a specific DB
+"""
+
+import sys
+import os
+import argparse
+import sqlite3
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.db.rollups import install_analytics_rollups, rebuild_analytics_rollups
+
+
+def rebuild(db_path: str) -> int:
+    """Rebuild (or install) the rollups in db_path. Returns the bucket row count."""
+    conn = sqlite3.connect(db_path)
+    try:
+        installed = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='analytics_rollups'"
+        ).fetchone()
+        if installed:
+            rebuild_analytics_rollups(conn)
+        else:
+            install_analytics_rollups(conn)
+        conn.commit()
+        return conn.execute("SELECT COUNT(*) FROM analytics_rollups").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild analytics_rollups from source tables")
+    parser.add_argument("--db", type=str, help="Database path override")
+    args = parser.parse_args()
+
+    if args.db:
+        db_path = args.db
+    else:
+        from src.config import DB_PATH
+        db_path = DB_PATH
+    if not os.path.exists(db_path):
+        print(f"Database not found at {db_path}")
+        return 1
+
+    start = time.perf_counter()
+    buckets = rebuild(db_path)
+    print(f"Rebuilt {buckets} rollup buckets in {time.perf_counter() - start:.2f}s ({db_path})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
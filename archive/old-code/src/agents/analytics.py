@@ -15,54 +15,37 @@ import sys
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
 from src.db import models
+from src.db.rollups import rollup_breakdown
 
 
-def get_reply_rates_by_persona() -> list:
-    """Reply rates grouped by persona type (QA Manager, VP Eng, etc.)."""
+def _rollup_reply_rates(dimension: str, label: str) -> list:
+    """Touch-level reply rates for one rollup dimension, busiest first."""
     conn = models.get_db()
-    rows = conn.execute("""
-        SELECT c.persona_type,
-               COUNT(DISTINCT c.id) as total,
-               COUNT(DISTINCT CASE WHEN bp.status IN ('replied', 'meeting_booked', 're-engaged')
-                     THEN c.id END) as replied
-        FROM contacts c
-        JOIN batch_prospects bp ON bp.contact_id = c.id
-        WHERE c.persona_type IS NOT NULL AND c.persona_type != ''
-        GROUP BY c.persona_type
-        ORDER BY total DESC
-    """).fetchall()
+    rows = rollup_breakdown(conn, dimension)
     conn.close()
 
+    rows = sorted((r for r in rows if r["value"] and r["touches"]),
+                  key=lambda r: r["touches"], reverse=True)
     return [{
-        "persona": r["persona_type"],
-        "total": r["total"],
-        "replied": r["replied"],
-        "reply_rate": round(r["replied"] / r["total"], 4) if r["total"] else 0.0,
+        label: r["value"],
+        "total": r["touches"],
+        "replied": r["replied_touches"],
+        "reply_rate": round(r["replied_touches"] / r["touches"], 4),
     } for r in rows]
 
 
-def get_reply_rates_by_vertical() -> list:
-    """Reply rates grouped by company vertical/industry."""
-    conn = models.get_db()
-    rows = conn.execute("""
-        SELECT c.company_industry,
-               COUNT(DISTINCT c.id) as total,
-               COUNT(DISTINCT CASE WHEN bp.status IN ('replied', 'meeting_booked', 're-engaged')
-                     THEN c.id END) as replied
-        FROM contacts c
-        JOIN batch_prospects bp ON bp.contact_id = c.id
-        WHERE c.company_industry IS NOT NULL AND c.company_industry != ''
-        GROUP BY c.company_industry
-        ORDER BY total DESC
-    """).fetchall()
-    conn.close()
+def get_reply_rates_by_persona() -> list:
+    """Reply rates grouped by persona type (QA Manager, VP Eng, etc.).
 
-    return [{
-        "vertical": r["company_industry"],
-        "total": r["total"],
-        "replied": r["replied"],
-        "reply_rate": round(r["replied"] / r["total"], 4) if r["total"] else 0.0,
-    } for r in rows]
+    total is touches sent and replied is touches that got a reply, read from
+    the analytics rollups.
+    """
+    return _rollup_reply_rates("persona", "persona")
+
+
+def get_reply_rates_by_vertical() -> list:
+    """Reply rates grouped by company vertical/industry (from the analytics rollups)."""
+    return _rollup_reply_rates("vertical", "vertical")
 
 
 def get_reply_rates_by_proof_point() -> list:
@@ -98,13 +98,10 @@ class BatchPipeline:
 
         Returns list of created contact IDs.
         """
-        contact_ids = []
-        for p in prospects:
-            # Create or find account
-            account = self._ensure_account(p)
+        accounts = self._ensure_accounts(prospects)
 
-            # Create contact
-            contact = models.create_contact({
+        contacts = models.create_contacts_many(
+            {
                 "account_id": account["id"],
                 "first_name": p["first_name"],
                 "last_name": p["last_name"],
@@ -118,11 +115,13 @@ class BatchPipeline:
                 "recently_hired": p.get("recently_hired", 0),
                 "stage": "new",
                 "source": "sales_nav",
-            })
-            contact_ids.append(contact["id"])
+            }
+            for p, account in zip(prospects, accounts)
+        )
+        contact_ids = [c["id"] for c in contacts]
 
-            # Link to batch
-            self._link_contact_to_batch(contact["id"])
+        # Link to batch
+        self._link_contacts_to_batch(contact_ids)
 
         self.contacts = contact_ids
         self._log_phase("extract", f"Stored {len(contact_ids)} prospects", {
@@ -298,39 +297,57 @@ class BatchPipeline:
 
     # ─── HELPERS ──────────────────────────────────────────────
 
-    def _ensure_account(self, prospect: dict) -> dict:
-        """Find or create account for a prospect's company."""
-        company = prospect.get("company", "")
-        if not company:
-            return models.create_account({"name": "Unknown"})
-
-        # Check if account already exists by name
-        conn = models.get_db()
-        row = conn.execute(
-            "SELECT * FROM accounts WHERE LOWER(name)=?",
-            (company.lower(),)
-        ).fetchone()
-        conn.close()
-
-        if row:
-            return dict(row)
+    def _ensure_accounts(self, prospects: list) -> list:
+        """Find or create accounts for each prospect's company.
 
-        return models.create_account({
-            "name": company,
-            "industry": prospect.get("vertical", ""),
-        })
+        Uses one lookup query and one insert transaction. Returns one account
+        dict per prospect, in order. Prospects at the same (case-insensitive)
+        company share an account; prospects without a company each get their
+        own "Unknown" account.
+        """
+        names = {p.get("company", "").lower() for p in prospects if p.get("company")}
+        existing = {}
+        if names:
+            conn = models.get_db()
+            placeholders = ",".join("?" for _ in names)
+            for row in conn.execute(
+                f"SELECT * FROM accounts WHERE LOWER(name) IN ({placeholders})", list(names)
+            ).fetchall():
+                existing.setdefault(row["name"].lower(), dict(row))
+            conn.close()
 
-    def _link_contact_to_batch(self, contact_id: str):
-        """Add contact to batch_prospects join table."""
+        to_create = []
+        slots = []  # per prospect: existing account dict, or index into to_create
+        new_by_name = {}
+        for p in prospects:
+            company = p.get("company", "")
+            key = company.lower()
+            if company and key in existing:
+                slots.append(existing[key])
+            elif company and key in new_by_name:
+                slots.append(new_by_name[key])
+            else:
+                if company:
+                    new_by_name[key] = len(to_create)
+                    to_create.append({"name": company, "industry": p.get("vertical", "")})
+                else:
+                    to_create.append({"name": "Unknown"})
+                slots.append(len(to_create) - 1)
+
+        created = models.create_accounts_many(to_create)
+        return [created[s] if isinstance(s, int) else s for s in slots]
+
+    def _link_contacts_to_batch(self, contact_ids: list):
+        """Add contacts to the batch_prospects join table in one transaction."""
+        if not contact_ids:
+            return
         conn = models.get_db()
         try:
-            conn.execute(
-                "INSERT INTO batch_prospects (batch_id, contact_id) VALUES (?,?)",
-                (self.batch_id, contact_id)
+            conn.executemany(
+                "INSERT OR IGNORE INTO batch_prospects (batch_id, contact_id) VALUES (?,?)",
+                [(self.batch_id, cid) for cid in contact_ids],
             )
             conn.commit()
-        except Exception:
-            pass  # Duplicate, ignore
         finally:
             conn.close()
 
@@ -25,6 +25,7 @@ from collections import defaultdict
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
 
 from src.db import models
+from src.db.rollups import MEASURES, rollup_breakdowns
 
 
 # ─── RESPONSE RECORDING ──────────────────────────────────────
@@ -250,8 +251,11 @@ def get_conversion_stats(days: int = 90) -> dict:
     Returns stats for: tone, proof point, pain hook, channel, touch number,
     opener style, and A/B groups.
 
+    Reads the daily analytics rollups (src.db.rollups), so the window is
+    rounded to whole UTC days.
+
     Args:
-        days: Look-back window in days.
+        days: Look-back window in days, today included.
 
     Returns:
         {"by_proof_point": {...}, "by_channel": {...}, "by_touch_number": {...},
@@ -259,76 +263,32 @@ def get_conversion_stats(days: int = 90) -> dict:
          "totals": {...}, "period_days": int}
     """
     conn = models.get_db()
-    cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
-
-    # Get all touchpoints in the period
-    touchpoints = conn.execute("""
-        SELECT t.*, md.proof_point_used, md.pain_hook, md.opener_style,
-               md.ask_style, md.ab_group, md.ab_variable,
-               md.personalization_score, md.touch_type
-        FROM touchpoints t
-        LEFT JOIN message_drafts md ON t.message_draft_id = md.id
-        WHERE t.sent_at >= ?
-    """, (cutoff,)).fetchall()
-    touchpoints = [dict(r) for r in touchpoints]
-
-    # Get all replies in the period
-    replies = conn.execute("""
-        SELECT r.*, t.contact_id as tp_contact_id
-        FROM replies r
-        LEFT JOIN touchpoints t ON r.touchpoint_id = t.id
-        WHERE r.replied_at >= ?
-    """, (cutoff,)).fetchall()
-    replies = [dict(r) for r in replies]
-
-    # Get meetings in the period
-    meetings = conn.execute("""
-        SELECT * FROM opportunities WHERE created_at >= ?
-    """, (cutoff,)).fetchall()
-    meetings = [dict(r) for r in meetings]
-
+    # Rollups are daily: the window is the last `days` UTC days, today included
+    since = (datetime.utcnow().date() - timedelta(days=days - 1)).isoformat()
+    rows = rollup_breakdowns(
+        conn, ("proof_point", "channel", "touch_number", "opener_style", "ab_group"), since)
     conn.close()
 
-    # Build reply lookup by touchpoint_id
-    reply_by_tp = {}
-    for r in replies:
-        tp_id = r.get("touchpoint_id")
-        if tp_id:
-            reply_by_tp[tp_id] = r
-
-    # Positive reply contacts
-    positive_reply_contacts = set()
-    for r in replies:
-        if r.get("intent") in ("positive", "referral"):
-            cid = r.get("contact_id") or r.get("tp_contact_id")
-            if cid:
-                positive_reply_contacts.add(cid)
-
-    # Meeting contacts
-    meeting_contacts = set()
-    for m in meetings:
-        cid = m.get("contact_id")
-        if cid:
-            meeting_contacts.add(cid)
-
-    # Compute breakdowns
+    # Every event lands in exactly one channel bucket, so those rows sum to the totals
+    totals = {m: sum(r[m] for r in rows["channel"]) for m in MEASURES}
+    touches = totals["touches"]
+
     stats = {
-        "by_proof_point": _breakdown(touchpoints, reply_by_tp, "proof_point_used"),
-        "by_channel": _breakdown(touchpoints, reply_by_tp, "channel"),
-        "by_touch_number": _breakdown(touchpoints, reply_by_tp, "touch_number"),
-        "by_opener_style": _breakdown(touchpoints, reply_by_tp, "opener_style"),
-        "by_ab_group": _breakdown(touchpoints, reply_by_tp, "ab_group"),
-        "by_subject_style": _breakdown(touchpoints, reply_by_tp, "subject_line_style"),
+        "by_proof_point": _rollup_breakdown_stats(rows["proof_point"]),
+        "by_channel": _rollup_breakdown_stats(rows["channel"]),
+        "by_touch_number": _rollup_breakdown_stats(rows["touch_number"]),
+        "by_opener_style": _rollup_breakdown_stats(rows["opener_style"]),
+        "by_ab_group": _rollup_breakdown_stats(rows["ab_group"]),
+        # message_drafts has no subject_line_style column, so every touch is (unknown)
+        "by_subject_style": _rollup_breakdown_stats([dict(r, value="") for r in rows["channel"]]),
         "totals": {
-            "touches_sent": len(touchpoints),
-            "replies_received": len(replies),
-            "positive_replies": len([r for r in replies if r.get("intent") in ("positive", "referral")]),
-            "meetings_booked": len(meetings),
-            "reply_rate": _safe_rate(len(replies), len(touchpoints)),
-            "positive_rate": _safe_rate(
-                len([r for r in replies if r.get("intent") in ("positive", "referral")]),
-                len(touchpoints)),
-            "meeting_rate": _safe_rate(len(meetings), len(touchpoints)),
+            "touches_sent": touches,
+            "replies_received": totals["replies"],
+            "positive_replies": totals["positive_replies"],
+            "meetings_booked": totals["meetings"],
+            "reply_rate": _safe_rate(totals["replies"], touches),
+            "positive_rate": _safe_rate(totals["positive_replies"], touches),
+            "meeting_rate": _safe_rate(totals["meetings"], touches),
         },
         "period_days": days,
     }
@@ -336,6 +296,23 @@ def get_conversion_stats(days: int = 90) -> dict:
     return stats
 
 
+def _rollup_breakdown_stats(rows: list) -> dict:
+    """Shape rollup rows like _breakdown(): sent/replied/positive per value, best first.
+
+    Only values with touches in the window are reported; replies count once
+    per replied touchpoint.
+    """
+    buckets = defaultdict(lambda: {"sent": 0, "replied": 0, "positive": 0})
+    for r in rows:
+        if not r["touches"]:
+            continue
+        b = buckets[r["value"] or "(unknown)"]
+        b["sent"] += r["touches"]
+        b["replied"] += r["replied_touches"]
+        b["positive"] += r["positive_touches"]
+    return _rates(buckets)
+
+
 def _breakdown(touchpoints: list, reply_by_tp: dict, field: str) -> dict:
     """Compute sent/replied/rate breakdown for a given field."""
     buckets = defaultdict(lambda: {"sent": 0, "replied": 0, "positive": 0})
@@ -353,7 +330,11 @@ def _breakdown(touchpoints: list, reply_by_tp: dict, field: str) -> dict:
             if reply_by_tp[tp_id].get("intent") in ("positive", "referral"):
                 buckets[value]["positive"] += 1
 
-    # Compute rates
+    return _rates(buckets)
+
+
+def _rates(buckets: dict) -> dict:
+    """Add reply/positive rates to sent/replied/positive buckets, sorted by positive_rate desc."""
     result = {}
     for value, counts in buckets.items():
         result[value] = {
@@ -680,7 +680,7 @@ def store_generated_messages(contact_id: str, generated: dict,
     generated: dict with keys like 'touch_1_inmail', 'touch_3_followup', etc.
     Each value has 'parsed' (from parse_touch_response) and metadata.
     """
-    stored = []
+    drafts = []
 
     touch_configs = [
         ("touch_1_inmail", "linkedin", 1, "inmail"),
@@ -734,8 +734,9 @@ def store_generated_messages(contact_id: str, generated: dict,
                 "approval_status": "draft",
             }
 
-        result = models.create_message_draft(msg_data)
-        stored.append(result)
+        drafts.append(msg_data)
+
+    stored = models.create_messages_many(drafts)
 
     # Store objection mapping on the contact
     if "objection" in generated:
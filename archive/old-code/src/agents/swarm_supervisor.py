@@ -3,8 +3,10 @@ Swarm Supervisor - Orchestrates multi-agent parallel processing.
 Coordinates research, drafting, QA, and sequencing across a batch of prospects.
 
 Safety controls:
-- Hard cap on parallelism (max_workers)
+- Hard cap on parallelism (max_workers per stage worker pool)
 - Dedupe keys prevent duplicate tasks
+- Per-task deadlines: a watchdog marks overrunning tasks 'timeout' and frees
+  their worker slot; agents check a cancellation token between steps
 - All outputs must reference stored research (no fabrication)
 - If research is missing, agent flags it rather than inventing
 - Feature flags control enablement
@@ -17,8 +19,10 @@ import uuid
 import json
 import time
 import logging
+import threading
+from collections import deque
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import CancelledError, Future, wait, FIRST_COMPLETED
 from typing import List, Dict, Optional, Callable
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
@@ -31,15 +35,133 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(levelna
 # ─── CONFIGURATION ─────────────────────────────────────────────
 
 DEFAULT_CONFIG = {
-    "max_workers": 3,           # Max parallel agent threads
+    "max_workers": 3,           # Max parallel agent threads per stage
+    "stage_workers": {},        # Optional per-stage overrides, e.g. {"research": 6}
     "max_tasks_per_run": 200,   # Hard cap on total tasks per swarm run
-    "task_timeout_seconds": 120, # Per-task timeout
+    "task_timeout_seconds": 120, # Per-task deadline, enforced by the watchdog
+    "watchdog_interval_seconds": 1.0,  # Max time between deadline checks
     "retry_max": 2,             # Max retries per task
     "channels": ["linkedin", "email"],  # Which channels to draft for
     "require_research": True,   # Block drafting if research is missing
     "qc_blocking": True,        # Block approval if QC fails
 }
 
+# Pipeline stages in order. A contact moves to the next stage only when its
+# result passes the stage's gate.
+STAGES = ("research", "draft", "qa", "sequence")
+
+STAGE_GATES = {
+    "research": lambda r: r.get("status") == "completed",
+    "draft": lambda r: r.get("status") == "completed",
+    "qa": lambda r: bool(r.get("passed")),
+}
+
+
+# ─── TASK RUNNER ───────────────────────────────────────────────
+
+class TaskCancelled(Exception):
+    """Raised inside a task when its CancellationToken has been cancelled."""
+
+
+class CancellationToken:
+    """Cooperative cancellation and deadline for one swarm task.
+
+    Tasks call check() between units of work; the supervisor cancels the
+    token on cancel() or when the watchdog sees the deadline pass.
+    """
+
+    def __init__(self, timeout_seconds: float = None):
+        self.timeout_seconds = timeout_seconds
+        self.deadline = None
+        self.reason = None
+        self._event = threading.Event()
+
+    def start(self):
+        """Start the deadline clock (called when the task begins running)."""
+        if self.timeout_seconds is not None:
+            self.deadline = time.monotonic() + self.timeout_seconds
+
+    def cancel(self, reason: str = "cancelled"):
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def expired(self, now: float = None) -> bool:
+        return self.deadline is not None and (now or time.monotonic()) >= self.deadline
+
+    def check(self):
+        """Raise TaskCancelled if the token was cancelled or its deadline passed."""
+        if self.expired():
+            self.cancel("timeout")
+        if self.cancelled:
+            raise TaskCancelled(self.reason)
+
+
+class StageRunner:
+    """Runs tasks on daemon threads with at most max_workers live at a time.
+
+    Unlike a ThreadPoolExecutor, a task that is abandoned (e.g. it hung past
+    its deadline) gives its slot back immediately, so one stuck call cannot
+    pin a worker and starve the rest of the queue.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self._queue = deque()
+        self._live = set()
+        self._lock = threading.Lock()
+
+    def submit(self, token: CancellationToken, fn, *args) -> Future:
+        future = Future()
+        with self._lock:
+            self._queue.append((future, token, fn, args))
+        self._dispatch()
+        return future
+
+    def abandon(self, future: Future):
+        """Stop waiting for a running task and free its slot."""
+        with self._lock:
+            self._live.discard(future)
+        self._dispatch()
+
+    def cancel_pending(self) -> int:
+        """Cancel every queued task that has not started. Returns how many."""
+        with self._lock:
+            pending, self._queue = list(self._queue), deque()
+        for future, _, _, _ in pending:
+            future.cancel()
+        return len(pending)
+
+    def _dispatch(self):
+        while True:
+            with self._lock:
+                if not self._queue or len(self._live) >= self.max_workers:
+                    return
+                future, token, fn, args = self._queue.popleft()
+                if not future.set_running_or_notify_cancel():
+                    continue
+                self._live.add(future)
+            threading.Thread(
+                target=self._run, args=(future, token, fn, args),
+                name=f"swarm_{self.name}", daemon=True,
+            ).start()
+
+    def _run(self, future: Future, token: CancellationToken, fn, args):
+        token.start()
+        try:
+            result = fn(*args, token)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        finally:
+            self.abandon(future)
+
 
 class SwarmSupervisor:
     """Orchestrates parallel agent processing for a batch of prospects."""
@@ -49,6 +171,8 @@ class SwarmSupervisor:
         self.run_id = None
         self.cancelled = False
         self._progress_callbacks = []
+        self._tokens = set()
+        self._tokens_lock = threading.Lock()
     
     def on_progress(self, callback: Callable):
         """Register a progress callback."""
@@ -63,7 +187,12 @@ class SwarmSupervisor:
                 pass
     
     def run_batch(self, contact_ids: List[str], batch_id: str = None) -> dict:
-        """Run the full swarm pipeline for a list of contacts."""
+        """Run the full swarm pipeline for a list of contacts.
+
+        Each contact flows through research -> draft -> qa -> sequence on its
+        own: as soon as one stage finishes for a contact, its next stage is
+        queued, so a slow contact never holds up the others.
+        """
         
         # Check feature flag
         if not models.is_feature_enabled("agent_swarm"):
@@ -83,44 +212,13 @@ class SwarmSupervisor:
         results = {
             "run_id": self.run_id,
             "total_contacts": len(contact_ids),
-            "phases": {},
+            "phases": {stage: {} for stage in STAGES},
             "errors": [],
         }
         
         try:
-            # Phase 1: Research (parallel)
-            research_results = self._run_phase("research", contact_ids)
-            results["phases"]["research"] = research_results
-            
-            if self.cancelled:
-                self._finalize("cancelled", results)
-                return results
-            
-            # Phase 2: Draft messages (parallel, depends on research)
-            researched_ids = [cid for cid, r in research_results.items() if r.get("status") == "completed"]
-            draft_results = self._run_phase("draft", researched_ids)
-            results["phases"]["draft"] = draft_results
-            
-            if self.cancelled:
-                self._finalize("cancelled", results)
-                return results
-            
-            # Phase 3: QA check (parallel, depends on drafts)
-            drafted_ids = [cid for cid, r in draft_results.items() if r.get("status") == "completed"]
-            qa_results = self._run_phase("qa", drafted_ids)
-            results["phases"]["qa"] = qa_results
-            
-            if self.cancelled:
-                self._finalize("cancelled", results)
-                return results
-            
-            # Phase 4: Sequence planning (parallel)
-            qa_passed_ids = [cid for cid, r in qa_results.items() if r.get("passed")]
-            sequence_results = self._run_phase("sequence", qa_passed_ids)
-            results["phases"]["sequence"] = sequence_results
-            
-            # Finalize
-            self._finalize("completed", results)
+            self._run_pipeline(contact_ids, results["phases"])
+            self._finalize("cancelled" if self.cancelled else "completed", results)
             
         except Exception as e:
             logger.error(f"Swarm run {self.run_id} failed: {e}")
@@ -129,82 +227,172 @@ class SwarmSupervisor:
         
         return results
     
-    def _run_phase(self, phase_name: str, contact_ids: List[str]) -> dict:
-        """Run a single phase across all contacts with bounded parallelism."""
-        logger.info(f"Phase '{phase_name}' starting for {len(contact_ids)} contacts")
-        self._emit("phase_started", {"phase": phase_name, "count": len(contact_ids)})
-        
-        results = {}
-        max_workers = min(self.config["max_workers"], len(contact_ids) or 1)
-        
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_cid = {}
-            for cid in contact_ids:
-                if self.cancelled:
-                    break
-                
-                # Create task with dedupe
-                task = models.create_swarm_task({
-                    "swarm_run_id": self.run_id,
-                    "agent_name": f"{phase_name}_agent",
-                    "task_type": phase_name,
-                    "contact_id": cid,
-                    "input_data": {"contact_id": cid, "phase": phase_name},
-                })
-                
-                if task.get("duplicate"):
-                    logger.info(f"Skipping duplicate task for {cid} in phase {phase_name}")
-                    results[cid] = {"status": "skipped", "reason": "duplicate"}
-                    continue
-                
-                future = executor.submit(self._execute_task, phase_name, cid, task["id"])
-                future_to_cid[future] = (cid, task["id"])
+    def _run_pipeline(self, contact_ids: List[str], phases: dict):
+        """Stream contacts through per-stage runners until every queue drains.
+
+        Task creation, dedupe, result bookkeeping and the deadline watchdog
+        stay on the calling thread; the runners only execute _execute_task.
+        A stage is closed (phase_completed) once every earlier stage is closed
+        and it has no tasks in flight.
+        """
+        stage_workers = self.config.get("stage_workers") or {}
+        runners = {
+            stage: StageRunner(stage, min(stage_workers.get(stage, self.config["max_workers"]),
+                                          len(contact_ids) or 1))
+            for stage in STAGES
+        }
+        in_flight = {}  # future -> (stage, contact_id, task_id, token)
+        started = set()
+        closed = 0
+        
+        for cid in contact_ids:
+            if self.cancelled:
+                break
+            self._submit("research", cid, runners, in_flight, phases, started)
+        
+        while True:
+            if self.cancelled:
+                for runner in runners.values():
+                    runner.cancel_pending()
             
-            for future in as_completed(future_to_cid):
-                cid, task_id = future_to_cid[future]
-                try:
-                    result = future.result(timeout=self.config["task_timeout_seconds"])
-                    results[cid] = result
-                    
-                    # Update task
-                    models.update_swarm_task(task_id, {
-                        "status": "completed" if result.get("status") == "completed" else "error",
-                        "output_data": result,
-                        "completed_at": datetime.utcnow().isoformat(),
-                    })
-                    
-                except Exception as e:
-                    logger.error(f"Task failed for {cid} in {phase_name}: {e}")
-                    results[cid] = {"status": "error", "error": str(e)}
-                    models.update_swarm_task(task_id, {
-                        "status": "error",
-                        "error_message": str(e),
-                        "completed_at": datetime.utcnow().isoformat(),
-                    })
+            # Close stages in order once they can receive no more work
+            busy = {entry[0] for entry in in_flight.values()}
+            while closed < len(STAGES) and STAGES[closed] not in busy:
+                self._close_stage(STAGES[closed], phases[STAGES[closed]], started)
+                closed += 1
+            if not in_flight:
+                break
+            
+            done, _ = wait(in_flight, timeout=self._watchdog_wait(in_flight),
+                           return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, cid, task_id, _ = in_flight.pop(future)
+                result = self._record_result(stage, cid, task_id, future)
+                phases[stage][cid] = result
                 
-                self._emit("task_completed", {
-                    "phase": phase_name,
-                    "contact_id": cid,
-                    "status": results[cid].get("status", "unknown"),
-                })
+                next_index = STAGES.index(stage) + 1
+                if next_index < len(STAGES) and not self.cancelled and STAGE_GATES[stage](result):
+                    self._submit(STAGES[next_index], cid, runners, in_flight, phases, started)
+            
+            # Watchdog: give up on tasks past their deadline and free their slots
+            now = time.monotonic()
+            for future, (stage, cid, task_id, token) in list(in_flight.items()):
+                if token.expired(now):
+                    in_flight.pop(future)
+                    token.cancel("timeout")
+                    runners[stage].abandon(future)
+                    phases[stage][cid] = self._record_timeout(stage, cid, task_id)
+    
+    def _watchdog_wait(self, in_flight: dict) -> float:
+        """Seconds until the nearest running deadline, capped by the watchdog interval."""
+        now = time.monotonic()
+        remaining = [entry[3].deadline - now for entry in in_flight.values()
+                     if entry[3].deadline is not None]
+        return max(0.0, min(remaining + [self.config["watchdog_interval_seconds"]]))
+    
+    def _submit(self, stage: str, contact_id: str, runners: dict, in_flight: dict,
+                phases: dict, started: set):
+        """Create the (deduped) task for one contact at one stage and queue it."""
+        if stage not in started:
+            started.add(stage)
+            logger.info(f"Phase '{stage}' starting")
+            self._emit("phase_started", {"phase": stage})
+        
+        task = models.create_swarm_task({
+            "swarm_run_id": self.run_id,
+            "agent_name": f"{stage}_agent",
+            "task_type": stage,
+            "contact_id": contact_id,
+            "input_data": {"contact_id": contact_id, "phase": stage},
+        })
         
-        # Update swarm run progress
-        completed = sum(1 for r in results.values() if r.get("status") == "completed")
-        failed = sum(1 for r in results.values() if r.get("status") == "error")
+        if task.get("duplicate"):
+            logger.info(f"Skipping duplicate task for {contact_id} in phase {stage}")
+            phases[stage][contact_id] = {"status": "skipped", "reason": "duplicate"}
+            return
+        
+        token = CancellationToken(self.config["task_timeout_seconds"])
+        with self._tokens_lock:
+            self._tokens.add(token)
+        future = runners[stage].submit(token, self._execute_task, stage, contact_id, task["id"])
+        future.add_done_callback(lambda _: self._forget_token(token))
+        in_flight[future] = (stage, contact_id, task["id"], token)
+    
+    def _forget_token(self, token: CancellationToken):
+        with self._tokens_lock:
+            self._tokens.discard(token)
+    
+    def _record_result(self, stage: str, contact_id: str, task_id: str, future) -> dict:
+        """Store a finished task's outcome on its swarm task and emit task_completed."""
+        try:
+            result = future.result()
+            models.update_swarm_task(task_id, {
+                "status": "completed" if result.get("status") == "completed" else "error",
+                "output_data": result,
+                "completed_at": datetime.utcnow().isoformat(),
+            })
+        except (TaskCancelled, CancelledError) as e:
+            reason = str(e) or "cancelled"
+            result = {"status": reason, "error": f"Task {reason}"}
+            models.update_swarm_task(task_id, {
+                "status": reason,
+                "error_message": result["error"],
+                "completed_at": datetime.utcnow().isoformat(),
+            })
+        except Exception as e:
+            logger.error(f"Task failed for {contact_id} in {stage}: {e}")
+            result = {"status": "error", "error": str(e)}
+            models.update_swarm_task(task_id, {
+                "status": "error",
+                "error_message": str(e),
+                "completed_at": datetime.utcnow().isoformat(),
+            })
+        
+        self._emit("task_completed", {
+            "phase": stage,
+            "contact_id": contact_id,
+            "status": result.get("status", "unknown"),
+        })
+        return result
+    
+    def _record_timeout(self, stage: str, contact_id: str, task_id: str) -> dict:
+        """Mark a task that overran its deadline as timeout."""
+        timeout = self.config["task_timeout_seconds"]
+        logger.error(f"Task timed out for {contact_id} in {stage} after {timeout}s")
+        result = {"status": "timeout", "error": f"Timed out after {timeout}s"}
+        models.update_swarm_task(task_id, {
+            "status": "timeout",
+            "error_message": result["error"],
+            "completed_at": datetime.utcnow().isoformat(),
+        })
+        self._emit("task_completed", {"phase": stage, "contact_id": contact_id, "status": "timeout"})
+        return result
+    
+    def _close_stage(self, stage: str, stage_results: dict, started: set):
+        """Roll a finished stage's counts into the swarm run and emit phase_completed."""
+        if stage not in started:
+            started.add(stage)
+            self._emit("phase_started", {"phase": stage})
+        
+        completed = sum(1 for r in stage_results.values() if r.get("status") == "completed")
+        failed = sum(1 for r in stage_results.values() if r.get("status") in ("error", "timeout"))
         swarm = models.get_swarm_run(self.run_id)
         models.update_swarm_run(self.run_id, {
             "completed_tasks": swarm.get("completed_tasks", 0) + completed,
             "failed_tasks": swarm.get("failed_tasks", 0) + failed,
         })
         
-        self._emit("phase_completed", {"phase": phase_name, "completed": completed, "failed": failed})
-        logger.info(f"Phase '{phase_name}' done: {completed} completed, {failed} failed")
-        
-        return results
+        self._emit("phase_completed", {"phase": stage, "completed": completed, "failed": failed})
+        logger.info(f"Phase '{stage}' done: {completed} completed, {failed} failed")
     
-    def _execute_task(self, phase_name: str, contact_id: str, task_id: str) -> dict:
-        """Execute a single agent task. Dispatches to the appropriate agent."""
-        
+    def _execute_task(self, phase_name: str, contact_id: str, task_id: str,
+                      token: CancellationToken) -> dict:
+        """Execute a single agent task. Dispatches to the appropriate agent.
+        
+        Raises TaskCancelled if the token is cancelled or its deadline passes
+        at one of the agent's check points.
+        """
+        token.check()
         models.update_swarm_task(task_id, {
             "status": "running",
             "started_at": datetime.utcnow().isoformat(),
@@ -219,9 +407,9 @@ class SwarmSupervisor:
         
         try:
             if phase_name == "research":
-                result = self._research_task(contact_id)
+                result = self._research_task(contact_id, token=token)
             elif phase_name == "draft":
-                result = self._draft_task(contact_id)
+                result = self._draft_task(contact_id, token=token)
             elif phase_name == "qa":
                 result = self._qa_task(contact_id)
             elif phase_name == "sequence":
@@ -236,12 +424,15 @@ class SwarmSupervisor:
             models.complete_agent_run(agent_run["id"], outputs={}, error=str(e))
             raise
     
-    def _research_task(self, contact_id: str) -> dict:
+    def _research_task(self, contact_id: str, token: CancellationToken = None) -> dict:
         """Research agent: check for existing research, compile brief."""
         contact = models.get_contact(contact_id)
         if not contact:
             return {"status": "error", "error": "Contact not found"}
         
+        if token:
+            token.check()
+        
         # Check for existing research
         conn = models.get_db()
         existing = conn.execute("""
@@ -269,7 +460,7 @@ class SwarmSupervisor:
             "contact_name": f"{contact.get('first_name', '')} {contact.get('last_name', '')}",
         }
     
-    def _draft_task(self, contact_id: str) -> dict:
+    def _draft_task(self, contact_id: str, token: CancellationToken = None) -> dict:
         """Writer agent: generate email and LinkedIn drafts from research."""
         contact = models.get_contact(contact_id)
         if not contact:
@@ -301,6 +492,8 @@ class SwarmSupervisor:
         channels = self.config.get("channels", ["linkedin", "email"])
         
         for channel in channels:
+            if token:
+                token.check()
             if channel == "email" and (email_suppressed or not email):
                 continue
             
@@ -468,8 +661,12 @@ class SwarmSupervisor:
         }
     
     def cancel(self):
-        """Cancel the swarm run."""
+        """Cancel the swarm run: stop queuing work and signal running tasks to stop."""
         self.cancelled = True
+        with self._tokens_lock:
+            tokens = list(self._tokens)
+        for token in tokens:
+            token.cancel()
         if self.run_id:
             models.update_swarm_run(self.run_id, {"status": "cancelled"})
     
@@ -24,6 +24,10 @@ DB_PATH = os.environ.get("OCC_DB_PATH", os.path.join(PROJECT_ROOT, "outreach.db"
 DB_EMAIL_PATH = os.environ.get("OCC_DB_EMAIL_PATH", os.path.join(PROJECT_ROOT, "api/data/outreach_email.db"))
 DB_LINKEDIN_PATH = os.environ.get("OCC_DB_LINKEDIN_PATH", os.path.join(PROJECT_ROOT, "api/data/outreach_linkedin.db"))
 DB_JOURNAL_MODE = os.environ.get("OCC_JOURNAL_MODE", "WAL")
+DB_POOL_ENABLED = os.environ.get("OCC_DB_POOL", "true").lower() == "true"
+DB_SYNCHRONOUS = os.environ.get("OCC_DB_SYNCHRONOUS", "NORMAL").upper()
+DB_CACHE_SIZE_KB = int(os.environ.get("OCC_DB_CACHE_SIZE_KB", "20000"))
+DB_MMAP_SIZE = int(os.environ.get("OCC_DB_MMAP_SIZE", str(256 * 1024 * 1024)))
 
 # ─── LLM ─────────────────────────────────────────────────────
 
@@ -59,6 +63,7 @@ ENABLE_FILE_WATCHER = os.environ.get("ENABLE_FILE_WATCHER", "false").lower() ==
 _VALID_LOG_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
 _VALID_LOG_FORMATS = {"text", "json"}
 _VALID_JOURNAL_MODES = {"WAL", "DELETE", "MEMORY", "OFF"}
+_VALID_SYNCHRONOUS = {"OFF", "NORMAL", "FULL", "EXTRA"}
 
 _errors = []
 
@@ -71,6 +76,12 @@ if LOG_FORMAT not in _VALID_LOG_FORMATS:
 if DB_JOURNAL_MODE not in _VALID_JOURNAL_MODES:
     _errors.append(f"OCC_JOURNAL_MODE must be one of {_VALID_JOURNAL_MODES}, got '{DB_JOURNAL_MODE}'")
 
+if DB_SYNCHRONOUS not in _VALID_SYNCHRONOUS:
+    _errors.append(f"OCC_DB_SYNCHRONOUS must be one of {_VALID_SYNCHRONOUS}, got '{DB_SYNCHRONOUS}'")
+
+if DB_MMAP_SIZE < 0:
+    _errors.append(f"OCC_DB_MMAP_SIZE must be >= 0, got {DB_MMAP_SIZE}")
+
 if OLLAMA_TIMEOUT < 1:
     _errors.append(f"OLLAMA_TIMEOUT_SECONDS must be positive, got {OLLAMA_TIMEOUT}")
 
@@ -107,6 +118,8 @@ def print_config():
     print(f"  DB_EMAIL_PATH:        {DB_EMAIL_PATH}")
     print(f"  DB_LINKEDIN_PATH:     {DB_LINKEDIN_PATH}")
     print(f"  DB_JOURNAL_MODE:      {DB_JOURNAL_MODE}")
+    print(f"  DB_POOL_ENABLED:      {DB_POOL_ENABLED}")
+    print(f"  DB_SYNCHRONOUS:       {DB_SYNCHRONOUS}")
     print(f"  OLLAMA_HOST:          {OLLAMA_HOST}")
     print(f"  OLLAMA_MODEL:         {OLLAMA_MODEL}")
     print(f"  OLLAMA_TIMEOUT:       {OLLAMA_TIMEOUT}s")
@@ -1,33 +1,217 @@
 """
 Database connection utilities.
-Centralizes DB_PATH, get_db(), get_db_conn() context manager, and gen_id().
+Centralizes DB_PATH, get_db(), get_db_conn() context manager, gen_id(), and the
+thread-affine connection pool shared by src.db.models.
+
+Pooling:
+    Each thread keeps one open sqlite3 connection per database file. PRAGMAs
+    (journal_mode, foreign_keys, synchronous, cache_size, mmap_size) are applied
+    once when that connection is opened instead of on every CRUD call.
+
+    get_db() hands out a PooledConnection proxy. Calling close() on it releases
+    the checkout instead of closing the underlying connection; when the
+    outermost checkout on a thread is released, any uncommitted transaction is
+    rolled back so callers see the same semantics as closing a real connection.
+
+    Set OCC_DB_POOL=false to fall back to one connection per call.
 """
 
 import logging
 import os
 import sqlite3
+import threading
 import uuid
 from contextlib import contextmanager
 from typing import Optional
 
+try:
+    from src.config import DB_POOL_ENABLED, DB_SYNCHRONOUS, DB_CACHE_SIZE_KB, DB_MMAP_SIZE
+except ImportError:
+    DB_POOL_ENABLED = os.environ.get("OCC_DB_POOL", "true").lower() == "true"
+    DB_SYNCHRONOUS = os.environ.get("OCC_DB_SYNCHRONOUS", "NORMAL").upper()
+    DB_CACHE_SIZE_KB = int(os.environ.get("OCC_DB_CACHE_SIZE_KB", "20000"))
+    DB_MMAP_SIZE = int(os.environ.get("OCC_DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+
 logger = logging.getLogger(__name__)
 
 DB_PATH = os.environ.get("OCC_DB_PATH", os.path.join(os.path.dirname(__file__), "../../outreach.db"))
 
 
-def get_db():
-    """Get a database connection with row_factory for dict-like access."""
-    conn = sqlite3.connect(DB_PATH)
+# ─── CONNECTION POOL ───────────────────────────────────────────
+
+def _file_identity(path: str) -> Optional[tuple]:
+    """Return (device, inode) for a database file, or None if it does not exist.
+
+    Used to detect a DB file that was deleted and re-created underneath a
+    pooled connection (common in tests that reset their database).
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def open_connection(db_path: str) -> sqlite3.Connection:
+    """Open a new SQLite connection with row_factory and PRAGMA tuning applied."""
+    conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
+    # Use DELETE journal mode in test environment to avoid WAL locking
     journal_mode = os.environ.get("OCC_JOURNAL_MODE", "WAL")
     conn.execute(f"PRAGMA journal_mode={journal_mode}")
     conn.execute("PRAGMA foreign_keys=ON")
+    conn.execute(f"PRAGMA synchronous={DB_SYNCHRONOUS}")
+    conn.execute(f"PRAGMA cache_size=-{DB_CACHE_SIZE_KB}")
+    conn.execute(f"PRAGMA mmap_size={DB_MMAP_SIZE}")
+    conn.execute("PRAGMA temp_store=MEMORY")
     return conn
 
 
+class PooledConnection:
+    """Proxy around a pooled sqlite3.Connection.
+
+    Behaves like the underlying connection (execute, commit, cursor, ...), but
+    close() returns the connection to the pool instead of closing it.
+    """
+
+    def __init__(self, pool: "ConnectionPool", entry: dict):
+        object.__setattr__(self, "_pool", pool)
+        object.__setattr__(self, "_entry", entry)
+        object.__setattr__(self, "_released", False)
+
+    @property
+    def raw(self) -> sqlite3.Connection:
+        """The underlying sqlite3.Connection."""
+        return self._entry["conn"]
+
+    def close(self):
+        if not self._released:
+            object.__setattr__(self, "_released", True)
+            self._pool._release(self._entry)
+
+    def __getattr__(self, name):
+        return getattr(self._entry["conn"], name)
+
+    def __setattr__(self, name, value):
+        setattr(self._entry["conn"], name, value)
+
+    def __enter__(self):
+        self._entry["conn"].__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return self._entry["conn"].__exit__(exc_type, exc, tb)
+
+    def __del__(self):
+        # A caller that forgot close() must not leave the checkout depth raised.
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    """Thread-affine SQLite connection pool.
+
+    Connections are keyed by (db_path, journal_mode) and owned by the thread
+    that opened them, so sqlite3's same-thread check still guards against
+    cross-thread use. Nested checkouts on the same thread share one connection
+    and are reference counted.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stats = {"opened": 0, "reused": 0, "closed": 0}
+
+    def _entries(self) -> dict:
+        entries = getattr(self._local, "entries", None)
+        if entries is None:
+            entries = {}
+            self._local.entries = entries
+        return entries
+
+    def _count(self, key: str):
+        with self._lock:
+            self._stats[key] += 1
+
+    def acquire(self, db_path: str):
+        """Check out a connection for the current thread.
+
+        Returns a PooledConnection, or a plain sqlite3.Connection when pooling
+        is disabled.
+        """
+        if not self.enabled:
+            self._count("opened")
+            return open_connection(db_path)
+
+        key = (os.path.abspath(db_path), os.environ.get("OCC_JOURNAL_MODE", "WAL"))
+        entries = self._entries()
+        entry = entries.get(key)
+
+        if entry is not None and entry["depth"] == 0 and entry["identity"] != _file_identity(key[0]):
+            self._discard(key, entry)
+            entry = None
+
+        if entry is None:
+            # Keep at most one idle connection per thread for other databases
+            for other_key, other in list(entries.items()):
+                if other["depth"] == 0:
+                    self._discard(other_key, other)
+            conn = open_connection(db_path)
+            entry = {"conn": conn, "depth": 0, "identity": _file_identity(key[0])}
+            entries[key] = entry
+            self._count("opened")
+        else:
+            self._count("reused")
+
+        entry["depth"] += 1
+        return PooledConnection(self, entry)
+
+    def _release(self, entry: dict):
+        entry["depth"] = max(0, entry["depth"] - 1)
+        if entry["depth"] == 0:
+            conn = entry["conn"]
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+                conn.row_factory = sqlite3.Row
+            except sqlite3.ProgrammingError:
+                # Connection was closed out from under us; drop it on next acquire
+                entry["identity"] = None
+
+    def _discard(self, key: tuple, entry: dict):
+        self._entries().pop(key, None)
+        try:
+            entry["conn"].close()
+        except Exception:
+            pass
+        self._count("closed")
+
+    def close_all(self):
+        """Close every idle connection owned by the calling thread."""
+        for key, entry in list(self._entries().items()):
+            if entry["depth"] == 0:
+                self._discard(key, entry)
+
+    def stats(self) -> dict:
+        """Return pool counters (opened/reused/closed) across all threads."""
+        with self._lock:
+            return dict(self._stats, enabled=self.enabled)
+
+
+pool = ConnectionPool(enabled=DB_POOL_ENABLED)
+
+
+def get_db():
+    """Get a database connection with row_factory for dict-like access."""
+    return pool.acquire(DB_PATH)
+
+
 @contextmanager
 def get_db_conn():
-    """Context manager for database connections. Ensures connections are always closed."""
+    """Context manager for database connections. Ensures connections are always released."""
     conn = get_db()
     try:
         yield conn
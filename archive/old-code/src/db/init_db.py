@@ -328,6 +328,7 @@ CREATE INDEX IF NOT EXISTS idx_messages_batch ON message_drafts(batch_id);
 CREATE INDEX IF NOT EXISTS idx_touchpoints_contact ON touchpoints(contact_id);
 CREATE INDEX IF NOT EXISTS idx_touchpoints_sent ON touchpoints(sent_at);
 CREATE INDEX IF NOT EXISTS idx_replies_contact ON replies(contact_id);
+CREATE INDEX IF NOT EXISTS idx_replies_touchpoint ON replies(touchpoint_id);
 CREATE INDEX IF NOT EXISTS idx_followups_due ON followups(due_date, state);
 CREATE INDEX IF NOT EXISTS idx_opportunities_contact ON opportunities(contact_id);
 CREATE INDEX IF NOT EXISTS idx_opportunities_status ON opportunities(status);
@@ -0,0 +1,14 @@
+"""
+Migration 004: Add trigger-maintained stats_counters for the dashboard.
+
+Counters for contacts, accounts, touchpoints, replies, opportunities and
+batches are kept current by AFTER INSERT/UPDATE/DELETE triggers, so
+get_dashboard_stats() no longer scans those tables on every page load.
+See src/db/stats.py for the counter definitions.
+"""
+
+from src.db.stats import install_stats_counters
+
+
+def up(conn):
+    install_stats_counters(conn)
@@ -0,0 +1,14 @@
+"""
+Migration 005: Add trigger-maintained analytics_rollups.
+
+Daily touch/reply/meeting buckets per persona, vertical, proof point, pain
+hook, opener style, A/B group, channel, touch number and personalization
+score, kept current by AFTER INSERT triggers on touchpoints, replies and
+opportunities. Existing rows are backfilled. See src/db/rollups.py.
+"""
+
+from src.db.rollups import install_analytics_rollups
+
+
+def up(conn):
+    install_analytics_rollups(conn)
@@ -12,6 +12,9 @@ from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
+from src.db.connection import pool
+from src.db.stats import dashboard_counts
+
 logger = logging.getLogger(__name__)
 
 DB_PATH = os.environ.get("OCC_DB_PATH", os.path.join(os.path.dirname(__file__), "../../outreach.db"))
@@ -48,19 +51,18 @@ SWARM_TASK_FIELDS = {
 
 
 def get_db():
-    """Get a database connection with row_factory for dict-like access."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    # Use DELETE journal mode in test environment to avoid WAL locking
-    journal_mode = os.environ.get("OCC_JOURNAL_MODE", "WAL")
-    conn.execute(f"PRAGMA journal_mode={journal_mode}")
-    conn.execute("PRAGMA foreign_keys=ON")
-    return conn
+    """Get a pooled database connection with row_factory for dict-like access.
+
+    Connections come from the thread-affine pool in src.db.connection, so
+    PRAGMA setup happens once per thread rather than once per call. close()
+    returns the connection to the pool.
+    """
+    return pool.acquire(DB_PATH)
 
 
 @contextmanager
 def get_db_conn():
-    """Context manager for database connections. Ensures connections are always closed."""
+    """Context manager for pooled database connections. Ensures connections are always released."""
     conn = get_db()
     try:
         yield conn
@@ -82,6 +84,53 @@ def _safe_update(table: str, record_id: str, data: dict, allowed_fields: set, id
         return dict(row) if row else None
 
 
+# SQLite's historical default for SQLITE_MAX_VARIABLE_NUMBER; keeps bulk
+# statements portable to older builds.
+_MAX_SQL_PARAMS = 999
+
+
+def _insert_sql(table: str, columns: tuple, row_count: int = 1, returning: bool = False) -> str:
+    placeholders = "(" + ",".join("?" for _ in columns) + ")"
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES " + ",".join([placeholders] * row_count)
+    if returning:
+        sql += " RETURNING *"
+    return sql
+
+
+def _insert_many(table: str, columns: tuple, rows: list, conn=None) -> list:
+    """Insert rows with multi-row INSERT ... RETURNING * statements.
+
+    Rows are chunked to stay under the bound-parameter limit, and all chunks
+    run in one transaction. The first value of each row must be its id; the
+    returned dicts are ordered to match the input rows.
+
+    If conn is given the caller owns the transaction (no commit here).
+    """
+    if not rows:
+        return []
+    per_stmt = max(1, _MAX_SQL_PARAMS // len(columns))
+    by_id = {}
+
+    def _run(c):
+        for i in range(0, len(rows), per_stmt):
+            chunk = rows[i:i + per_stmt]
+            params = [v for row in chunk for v in row]
+            for r in c.execute(_insert_sql(table, columns, len(chunk), returning=True), params).fetchall():
+                by_id[r["id"]] = dict(r)
+
+    if conn is not None:
+        _run(conn)
+    else:
+        with get_db_conn() as c:
+            try:
+                _run(c)
+                c.commit()
+            except Exception:
+                c.rollback()
+                raise
+    return [by_id[row[0]] for row in rows]
+
+
 def gen_id(prefix=""):
     """Generate a prefixed UUID."""
     short = uuid.uuid4().hex[:12]
@@ -90,18 +139,17 @@ def gen_id(prefix=""):
 
 # ─── ACCOUNTS ───────────────────────────────────────────────────
 
-def create_account(data: dict) -> dict:
-    conn = get_db()
-    aid = data.get("id", gen_id("acc"))
-    now = datetime.now(timezone.utc).isoformat()
-    conn.execute("""
-        INSERT INTO accounts (id, name, domain, industry, sub_industry, employee_count,
-            employee_band, tier, known_tools, linkedin_company_url, website_url,
-            buyer_intent, buyer_intent_date, annual_revenue, funding_stage,
-            last_funding_date, last_funding_amount, hq_location, notes, research_freshness,
-            created_at, updated_at)
-        VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-    """, (
+ACCOUNT_INSERT_COLUMNS = (
+    "id", "name", "domain", "industry", "sub_industry", "employee_count",
+    "employee_band", "tier", "known_tools", "linkedin_company_url", "website_url",
+    "buyer_intent", "buyer_intent_date", "annual_revenue", "funding_stage",
+    "last_funding_date", "last_funding_amount", "hq_location", "notes", "research_freshness",
+    "created_at", "updated_at",
+)
+
+
+def _account_values(aid: str, data: dict, now: str) -> tuple:
+    return (
         aid, data.get("name"), data.get("domain"), data.get("industry"),
         data.get("sub_industry"), data.get("employee_count"), data.get("employee_band"),
         data.get("tier"), json.dumps(data.get("known_tools", [])),
@@ -111,13 +159,27 @@ def create_account(data: dict) -> dict:
         data.get("last_funding_date"), data.get("last_funding_amount"),
         data.get("hq_location"), data.get("notes"), data.get("research_freshness"),
         now, now
-    ))
+    )
+
+
+def create_account(data: dict) -> dict:
+    conn = get_db()
+    aid = data.get("id", gen_id("acc"))
+    now = datetime.now(timezone.utc).isoformat()
+    conn.execute(_insert_sql("accounts", ACCOUNT_INSERT_COLUMNS), _account_values(aid, data, now))
     conn.commit()
     row = conn.execute("SELECT * FROM accounts WHERE id=?", (aid,)).fetchone()
     conn.close()
     return dict(row)
 
 
+def create_accounts_many(items) -> list:
+    """Insert many accounts in a single transaction. Returns rows in input order."""
+    now = datetime.now(timezone.utc).isoformat()
+    rows = [_account_values(d.get("id", gen_id("acc")), d, now) for d in items]
+    return _insert_many("accounts", ACCOUNT_INSERT_COLUMNS, rows)
+
+
 def get_account(account_id: str) -> Optional[dict]:
     conn = get_db()
     row = conn.execute("SELECT * FROM accounts WHERE id=?", (account_id,)).fetchone()
@@ -146,18 +208,17 @@ def update_account(account_id: str, data: dict) -> Optional[dict]:
 
 # ─── CONTACTS ───────────────────────────────────────────────────
 
-def create_contact(data: dict) -> dict:
-    conn = get_db()
-    cid = data.get("id", gen_id("con"))
-    now = datetime.now(timezone.utc).isoformat()
-    conn.execute("""
-        INSERT INTO contacts (id, account_id, first_name, last_name, title, persona_type,
-            seniority_level, email, email_verified, linkedin_url, phone, location, timezone,
-            tenure_months, recently_hired, previous_company, previous_title, stage,
-            priority_score, priority_factors, personalization_score, predicted_objection,
-            objection_response, status, do_not_contact, dnc_reason, source, created_at, updated_at)
-        VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-    """, (
+CONTACT_INSERT_COLUMNS = (
+    "id", "account_id", "first_name", "last_name", "title", "persona_type",
+    "seniority_level", "email", "email_verified", "linkedin_url", "phone", "location", "timezone",
+    "tenure_months", "recently_hired", "previous_company", "previous_title", "stage",
+    "priority_score", "priority_factors", "personalization_score", "predicted_objection",
+    "objection_response", "status", "do_not_contact", "dnc_reason", "source", "created_at", "updated_at",
+)
+
+
+def _contact_values(cid: str, data: dict, now: str) -> tuple:
+    return (
         cid, data.get("account_id"), data["first_name"], data["last_name"],
         data.get("title"), data.get("persona_type"), data.get("seniority_level"),
         data.get("email"), data.get("email_verified", 0), data.get("linkedin_url"),
@@ -170,13 +231,34 @@ def create_contact(data: dict) -> dict:
         data.get("objection_response"), data.get("status", "active"),
         data.get("do_not_contact", 0), data.get("dnc_reason"),
         data.get("source", "sales_nav"), now, now
-    ))
+    )
+
+
+def create_contact(data: dict) -> dict:
+    conn = get_db()
+    cid = data.get("id", gen_id("con"))
+    now = datetime.now(timezone.utc).isoformat()
+    conn.execute(_insert_sql("contacts", CONTACT_INSERT_COLUMNS), _contact_values(cid, data, now))
     conn.commit()
     row = conn.execute("SELECT * FROM contacts WHERE id=?", (cid,)).fetchone()
     conn.close()
     return dict(row)
 
 
+def create_contacts_many(items) -> list:
+    """Insert many contacts in a single transaction.
+
+    Args:
+        items: Iterable of contact dicts (same shape as create_contact).
+
+    Returns:
+        List of inserted contact rows (dicts), in input order.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    rows = [_contact_values(d.get("id", gen_id("con")), d, now) for d in items]
+    return _insert_many("contacts", CONTACT_INSERT_COLUMNS, rows)
+
+
 def get_contact(contact_id: str) -> Optional[dict]:
     conn = get_db()
     row = conn.execute("""
@@ -333,17 +415,16 @@ def score_and_save(contact_id: str) -> dict:
 
 # ─── MESSAGE DRAFTS ─────────────────────────────────────────────
 
-def create_message_draft(data: dict) -> dict:
-    conn = get_db()
-    mid = data.get("id", gen_id("msg"))
-    now = datetime.now(timezone.utc).isoformat()
-    conn.execute("""
-        INSERT INTO message_drafts (id, contact_id, batch_id, channel, touch_number,
-            touch_type, subject_line, body, version, personalization_score, proof_point_used,
-            pain_hook, opener_style, ask_style, word_count, qc_passed, qc_flags, qc_run_id,
-            approval_status, ab_group, ab_variable, agent_run_id, created_at, updated_at)
-        VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-    """, (
+MESSAGE_DRAFT_INSERT_COLUMNS = (
+    "id", "contact_id", "batch_id", "channel", "touch_number",
+    "touch_type", "subject_line", "body", "version", "personalization_score", "proof_point_used",
+    "pain_hook", "opener_style", "ask_style", "word_count", "qc_passed", "qc_flags", "qc_run_id",
+    "approval_status", "ab_group", "ab_variable", "agent_run_id", "created_at", "updated_at",
+)
+
+
+def _message_draft_values(mid: str, data: dict, now: str) -> tuple:
+    return (
         mid, data.get("contact_id"), data.get("batch_id"), data["channel"],
         data.get("touch_number"), data["touch_type"], data.get("subject_line"),
         data["body"], data.get("version", 1), data.get("personalization_score"),
@@ -352,13 +433,35 @@ def create_message_draft(data: dict) -> dict:
         json.dumps(data.get("qc_flags", [])), data.get("qc_run_id"),
         data.get("approval_status", "draft"), data.get("ab_group"),
         data.get("ab_variable"), data.get("agent_run_id"), now, now
-    ))
+    )
+
+
+def create_message_draft(data: dict) -> dict:
+    conn = get_db()
+    mid = data.get("id", gen_id("msg"))
+    now = datetime.now(timezone.utc).isoformat()
+    conn.execute(_insert_sql("message_drafts", MESSAGE_DRAFT_INSERT_COLUMNS),
+                 _message_draft_values(mid, data, now))
     conn.commit()
     row = conn.execute("SELECT * FROM message_drafts WHERE id=?", (mid,)).fetchone()
     conn.close()
     return dict(row)
 
 
+def create_messages_many(items) -> list:
+    """Insert many message drafts in a single transaction.
+
+    Args:
+        items: Iterable of draft dicts (same shape as create_message_draft).
+
+    Returns:
+        List of inserted message_drafts rows (dicts), in input order.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    rows = [_message_draft_values(d.get("id", gen_id("msg")), d, now) for d in items]
+    return _insert_many("message_drafts", MESSAGE_DRAFT_INSERT_COLUMNS, rows)
+
+
 def get_messages_for_contact(contact_id: str) -> list:
     conn = get_db()
     rows = conn.execute("""
@@ -398,34 +501,72 @@ def list_messages(batch_id=None, channel=None, approval_status=None, limit=100)
 
 # ─── TOUCHPOINTS ────────────────────────────────────────────────
 
-def log_touchpoint(data: dict) -> dict:
-    conn = get_db()
-    tid = gen_id("tp")
-    now = datetime.now(timezone.utc).isoformat()
-    conn.execute("""
-        INSERT INTO touchpoints (id, contact_id, message_draft_id, channel,
-            touch_number, sent_at, outcome, call_duration_seconds, call_notes,
-            confirmed_by_user, created_at)
-        VALUES (?,?,?,?,?,?,?,?,?,?,?)
-    """, (
+TOUCHPOINT_INSERT_COLUMNS = (
+    "id", "contact_id", "message_draft_id", "channel",
+    "touch_number", "sent_at", "outcome", "call_duration_seconds", "call_notes",
+    "confirmed_by_user", "created_at",
+)
+
+# Contact stage after a given touch number is logged
+TOUCH_STAGE_MAP = {1: "touched", 2: "touched", 3: "sequencing", 4: "sequencing", 5: "sequencing", 6: "break_up_sent"}
+
+
+def _touchpoint_values(tid: str, data: dict, now: str) -> tuple:
+    return (
         tid, data["contact_id"], data.get("message_draft_id"), data["channel"],
         data.get("touch_number"), data.get("sent_at", now), data.get("outcome"),
         data.get("call_duration_seconds"), data.get("call_notes"),
         data.get("confirmed_by_user", 1), now
-    ))
+    )
+
+
+def log_touchpoint(data: dict) -> dict:
+    conn = get_db()
+    tid = gen_id("tp")
+    now = datetime.now(timezone.utc).isoformat()
+    conn.execute(_insert_sql("touchpoints", TOUCHPOINT_INSERT_COLUMNS), _touchpoint_values(tid, data, now))
     conn.commit()
 
     # Update contact stage based on touch
-    stage_map = {1: "touched", 2: "touched", 3: "sequencing", 4: "sequencing", 5: "sequencing", 6: "break_up_sent"}
     touch_num = data.get("touch_number", 1)
-    if touch_num in stage_map:
-        update_contact(data["contact_id"], {"stage": stage_map[touch_num]})
+    if touch_num in TOUCH_STAGE_MAP:
+        update_contact(data["contact_id"], {"stage": TOUCH_STAGE_MAP[touch_num]})
 
     row = conn.execute("SELECT * FROM touchpoints WHERE id=?", (tid,)).fetchone()
     conn.close()
     return dict(row)
 
 
+def log_touchpoints_many(items) -> list:
+    """Log many touchpoints and apply the resulting contact stage updates in one transaction.
+
+    When a contact appears more than once, the last touch in input order sets
+    its stage, matching what sequential log_touchpoint calls would do.
+
+    Returns:
+        List of inserted touchpoint rows (dicts), in input order.
+    """
+    items = list(items)
+    now = datetime.now(timezone.utc).isoformat()
+    rows = [_touchpoint_values(gen_id("tp"), d, now) for d in items]
+
+    stages = {}
+    for d in items:
+        touch_num = d.get("touch_number", 1)
+        if touch_num in TOUCH_STAGE_MAP:
+            stages[d["contact_id"]] = TOUCH_STAGE_MAP[touch_num]
+
+    with get_db_conn() as conn:
+        inserted = _insert_many("touchpoints", TOUCHPOINT_INSERT_COLUMNS, rows, conn=conn)
+        if stages:
+            conn.executemany(
+                "UPDATE contacts SET stage=?, updated_at=? WHERE id=?",
+                [(stage, now, cid) for cid, stage in stages.items()],
+            )
+        conn.commit()
+    return inserted
+
+
 # ─── REPLIES ────────────────────────────────────────────────────
 
 def log_reply(data: dict) -> dict:
@@ -691,19 +832,15 @@ def audit(table_name: str, record_id: str, action: str,
 # ─── ANALYTICS QUERIES ──────────────────────────────────────────
 
 def get_dashboard_stats() -> dict:
-    """Get high-level stats for the home page."""
+    """Get high-level stats for the home page.
+
+    All counters come from one round trip (see src.db.stats): trigger-maintained
+    stats_counters when migration 004 is applied, otherwise a single-pass
+    aggregate query.
+    """
     conn = get_db()
-    stats = {}
-
-    stats["total_contacts"] = conn.execute("SELECT COUNT(*) FROM contacts WHERE status='active'").fetchone()[0]
-    stats["total_accounts"] = conn.execute("SELECT COUNT(*) FROM accounts").fetchone()[0]
-    stats["touches_sent"] = conn.execute("SELECT COUNT(*) FROM touchpoints").fetchone()[0]
-    stats["total_replies"] = conn.execute("SELECT COUNT(*) FROM replies").fetchone()[0]
-    stats["positive_replies"] = conn.execute("SELECT COUNT(*) FROM replies WHERE intent='positive'").fetchone()[0]
-    stats["meetings_booked"] = conn.execute("SELECT COUNT(*) FROM opportunities WHERE status IN ('meeting_booked','meeting_held','opportunity_created')").fetchone()[0]
-    stats["opportunities_created"] = conn.execute("SELECT COUNT(*) FROM opportunities WHERE opportunity_created=1").fetchone()[0]
-    stats["pending_followups"] = conn.execute("SELECT COUNT(*) FROM followups WHERE state='pending' AND due_date<=datetime('now')").fetchone()[0]
-    stats["active_batches"] = conn.execute("SELECT COUNT(*) FROM batches WHERE status IN ('building','active')").fetchone()[0]
+    stats = dashboard_counts(conn)
+    conn.close()
 
     # Reply rate
     if stats["touches_sent"] > 0:
@@ -717,7 +854,6 @@ def get_dashboard_stats() -> dict:
     else:
         stats["meeting_rate"] = 0
 
-    conn.close()
     return stats
 
 
@@ -990,82 +1126,78 @@ def get_batch_summary(batch_id: str) -> dict:
 
 # ─── INTELLIGENCE DATA ────────────────────────────────────────
 
-def get_intelligence_data() -> dict:
-    """Aggregated analytics for Intelligence page."""
-    conn = get_db()
-    intelligence = {}
+# Touch and reply counts are pre-aggregated per contact / per touchpoint and
+# then joined, so each contact or draft contributes one row instead of the
+# touchpoints x replies fan-out of a direct LEFT JOIN (which needed
+# COUNT(DISTINCT ...) to undo). Each query groups by both of its dimensions
+# at once; _fold_rollup() then sums the rows per dimension.
+_CONTACT_ROLLUP_SQL = """
+    WITH touch_counts AS (
+        SELECT contact_id, COUNT(*) AS touches FROM touchpoints GROUP BY contact_id
+    ),
+    reply_counts AS (
+        SELECT contact_id, COUNT(*) AS replies FROM replies GROUP BY contact_id
+    )
+    SELECT c.persona_type, a.industry,
+           COALESCE(SUM(tc.touches), 0) AS touches,
+           COALESCE(SUM(rc.replies), 0) AS replies
+    FROM contacts c
+    LEFT JOIN accounts a ON c.account_id = a.id
+    LEFT JOIN touch_counts tc ON tc.contact_id = c.id
+    LEFT JOIN reply_counts rc ON rc.contact_id = c.id
+    WHERE c.persona_type IS NOT NULL OR a.industry IS NOT NULL
+    GROUP BY c.persona_type, a.industry
+"""
 
-    # Reply rates by persona
-    rows = conn.execute("""
-        SELECT c.persona_type,
-               COUNT(DISTINCT tp.id) as touches,
-               COUNT(DISTINCT r.id) as replies
-        FROM contacts c
-        LEFT JOIN touchpoints tp ON tp.contact_id = c.id
-        LEFT JOIN replies r ON r.contact_id = c.id
-        WHERE c.persona_type IS NOT NULL
-        GROUP BY c.persona_type
-    """).fetchall()
-    intelligence["by_persona"] = [
-        {"persona": r["persona_type"], "touches": r["touches"], "replies": r["replies"],
-         "rate": round(r["replies"] / max(r["touches"], 1) * 100, 1)}
-        for r in rows
-    ]
+_DRAFT_ROLLUP_SQL = """
+    WITH touch_replies AS (
+        SELECT touchpoint_id, COUNT(*) AS replies FROM replies
+        WHERE touchpoint_id IS NOT NULL GROUP BY touchpoint_id
+    )
+    SELECT md.proof_point_used, md.personalization_score,
+           COUNT(tp.id) AS touches,
+           COALESCE(SUM(tr.replies), 0) AS replies
+    FROM message_drafts md
+    LEFT JOIN touchpoints tp ON tp.message_draft_id = md.id
+    LEFT JOIN touch_replies tr ON tr.touchpoint_id = tp.id
+    WHERE md.proof_point_used IS NOT NULL OR md.personalization_score IS NOT NULL
+    GROUP BY md.proof_point_used, md.personalization_score
+"""
 
-    # Reply rates by vertical
-    rows = conn.execute("""
-        SELECT a.industry,
-               COUNT(DISTINCT tp.id) as touches,
-               COUNT(DISTINCT r.id) as replies
-        FROM contacts c
-        LEFT JOIN accounts a ON c.account_id = a.id
-        LEFT JOIN touchpoints tp ON tp.contact_id = c.id
-        LEFT JOIN replies r ON r.contact_id = c.id
-        WHERE a.industry IS NOT NULL
-        GROUP BY a.industry
-    """).fetchall()
-    intelligence["by_vertical"] = [
-        {"vertical": r["industry"], "touches": r["touches"], "replies": r["replies"],
-         "rate": round(r["replies"] / max(r["touches"], 1) * 100, 1)}
-        for r in rows
-    ]
 
-    # Reply rates by proof point
-    rows = conn.execute("""
-        SELECT md.proof_point_used,
-               COUNT(DISTINCT tp.id) as touches,
-               COUNT(DISTINCT r.id) as replies
-        FROM message_drafts md
-        LEFT JOIN touchpoints tp ON tp.message_draft_id = md.id
-        LEFT JOIN replies r ON r.touchpoint_id = tp.id
-        WHERE md.proof_point_used IS NOT NULL
-        GROUP BY md.proof_point_used
-    """).fetchall()
-    intelligence["by_proof_point"] = [
-        {"proof_point": r["proof_point_used"], "touches": r["touches"], "replies": r["replies"],
-         "rate": round(r["replies"] / max(r["touches"], 1) * 100, 1)}
-        for r in rows
+def _fold_rollup(rows: list, column: str, label: str) -> list:
+    """Sum touches/replies of rollup rows per value of one column (NULLs skipped)."""
+    totals = {}
+    for r in rows:
+        if r[column] is None:
+            continue
+        t = totals.setdefault(r[column], [0, 0])
+        t[0] += r["touches"]
+        t[1] += r["replies"]
+    # Numbers before text, matching SQLite's GROUP BY ordering
+    ordered = sorted(totals.items(), key=lambda kv: (isinstance(kv[0], str), kv[0]))
+    return [
+        {label: value, "touches": touches, "replies": replies,
+         "rate": round(replies / max(touches, 1) * 100, 1)}
+        for value, (touches, replies) in ordered
     ]
 
-    # Reply rates by personalization score
-    rows = conn.execute("""
-        SELECT md.personalization_score,
-               COUNT(DISTINCT tp.id) as touches,
-               COUNT(DISTINCT r.id) as replies
-        FROM message_drafts md
-        LEFT JOIN touchpoints tp ON tp.message_draft_id = md.id
-        LEFT JOIN replies r ON r.touchpoint_id = tp.id
-        WHERE md.personalization_score IS NOT NULL
-        GROUP BY md.personalization_score
-    """).fetchall()
-    intelligence["by_personalization"] = [
-        {"score": r["personalization_score"], "touches": r["touches"], "replies": r["replies"],
-         "rate": round(r["replies"] / max(r["touches"], 1) * 100, 1)}
-        for r in rows
-    ]
 
+def get_intelligence_data() -> dict:
+    """Aggregated analytics for Intelligence page."""
+    conn = get_db()
+    contact_rows = conn.execute(_CONTACT_ROLLUP_SQL).fetchall()
+    draft_rows = conn.execute(_DRAFT_ROLLUP_SQL).fetchall()
     conn.close()
-    return intelligence
+
+    return {
+        # Reply rates by persona / vertical
+        "by_persona": _fold_rollup(contact_rows, "persona_type", "persona"),
+        "by_vertical": _fold_rollup(contact_rows, "industry", "vertical"),
+        # Reply rates by proof point / personalization score
+        "by_proof_point": _fold_rollup(draft_rows, "proof_point_used", "proof_point"),
+        "by_personalization": _fold_rollup(draft_rows, "personalization_score", "score"),
+    }
 
 
 # ─── SYNC FROM HTML ────────────────────────────────────────────
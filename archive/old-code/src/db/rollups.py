@@ -0,0 +1,258 @@
+"""
+Analytics rollups.
+
+Touch, reply and meeting counts are pre-aggregated into daily buckets keyed by
+one message/contact attribute at a time (persona, vertical, proof point, pain
+hook, opener style, A/B group, channel, touch number, personalization score),
+so reply-rate breakdowns read a few hundred rollup rows instead of re-joining
+touchpoints, replies, drafts and contacts on every request.
+
+The analytics_rollups table is installed by migration 005 and kept current by
+AFTER INSERT triggers on touchpoints, replies and opportunities, so every write
+path (log_touchpoint, log_touchpoints_many, log_reply, record_reply,
+create_opportunity, ...) updates it. Attribution is captured when the event is
+written; after editing or deleting source rows, or to backfill an existing
+database, run scripts/rebuild_rollups.py.
+
+Bucketing:
+    touches          - one per touchpoint, on its sent_at day
+    replies          - one per reply, on the replied-to touch's day (or the
+                       reply's own day when it has no touchpoint)
+    positive_replies - replies with intent positive/referral
+    replied_touches  - touchpoints with at least one reply (counted once)
+    positive_touches - touchpoints with at least one positive/referral reply
+    meetings         - one per opportunity, on its created_at day
+
+Persona and vertical come from the contact on the event. Draft attributes
+come from the touchpoint's message draft; opportunities prefer their own
+attribution_* columns and fall back to the trigger touchpoint's draft.
+Missing values are stored as ''.
+
+When the table is not installed, rollup_breakdown() computes the same numbers
+live from the source tables.
+"""
+
+import logging
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+
+DIMENSIONS = (
+    "persona", "vertical", "proof_point", "pain_hook", "opener_style",
+    "ab_group", "channel", "touch_number", "personalization_score",
+)
+
+MEASURES = (
+    "touches", "replies", "positive_replies", "replied_touches",
+    "positive_touches", "meetings",
+)
+
+POSITIVE_INTENTS = "('positive', 'referral')"
+
+
+# ─── EVENT SOURCES ──────────────────────────────────────────────
+# Each source yields one row per event with a day, one column per dimension
+# and one column per measure. {where} narrows it to a single row in triggers.
+_SOURCES = {
+    "touchpoints": """
+        SELECT COALESCE(date(t.sent_at), '') AS day,
+               c.persona_type AS persona, a.industry AS vertical,
+               md.proof_point_used AS proof_point, md.pain_hook AS pain_hook,
+               md.opener_style AS opener_style, md.ab_group AS ab_group,
+               t.channel AS channel, t.touch_number AS touch_number,
+               md.personalization_score AS personalization_score,
+               1 AS touches, 0 AS replies, 0 AS positive_replies,
+               0 AS replied_touches, 0 AS positive_touches, 0 AS meetings
+        FROM touchpoints t
+        LEFT JOIN message_drafts md ON md.id = t.message_draft_id
+        LEFT JOIN contacts c ON c.id = t.contact_id
+        LEFT JOIN accounts a ON a.id = c.account_id
+        {where}
+    """,
+    "replies": f"""
+        SELECT COALESCE(date(t.sent_at), date(r.replied_at), date(r.created_at), '') AS day,
+               c.persona_type AS persona, a.industry AS vertical,
+               md.proof_point_used AS proof_point, md.pain_hook AS pain_hook,
+               md.opener_style AS opener_style, md.ab_group AS ab_group,
+               COALESCE(t.channel, r.channel) AS channel, t.touch_number AS touch_number,
+               md.personalization_score AS personalization_score,
+               0 AS touches, 1 AS replies,
+               (CASE WHEN r.intent IN {POSITIVE_INTENTS} THEN 1 ELSE 0 END) AS positive_replies,
+               (CASE WHEN t.id IS NOT NULL AND NOT EXISTS (
+                    SELECT 1 FROM replies p
+                    WHERE p.touchpoint_id = r.touchpoint_id AND p.rowid < r.rowid)
+                THEN 1 ELSE 0 END) AS replied_touches,
+               (CASE WHEN t.id IS NOT NULL AND r.intent IN {POSITIVE_INTENTS} AND NOT EXISTS (
+                    SELECT 1 FROM replies p
+                    WHERE p.touchpoint_id = r.touchpoint_id AND p.rowid < r.rowid
+                      AND p.intent IN {POSITIVE_INTENTS})
+                THEN 1 ELSE 0 END) AS positive_touches,
+               0 AS meetings
+        FROM replies r
+        LEFT JOIN touchpoints t ON t.id = r.touchpoint_id
+        LEFT JOIN message_drafts md ON md.id = t.message_draft_id
+        LEFT JOIN contacts c ON c.id = r.contact_id
+        LEFT JOIN accounts a ON a.id = c.account_id
+        {{where}}
+    """,
+    "opportunities": """
+        SELECT COALESCE(date(o.created_at), '') AS day,
+               c.persona_type AS persona, a.industry AS vertical,
+               COALESCE(o.attribution_proof_point, md.proof_point_used) AS proof_point,
+               COALESCE(o.attribution_pain_hook, md.pain_hook) AS pain_hook,
+               COALESCE(o.attribution_opener_style, md.opener_style) AS opener_style,
+               COALESCE(o.attribution_ab_group, md.ab_group) AS ab_group,
+               COALESCE(o.attribution_channel, t.channel) AS channel,
+               COALESCE(o.attribution_touch_number, t.touch_number) AS touch_number,
+               COALESCE(o.attribution_personalization_score, md.personalization_score)
+                   AS personalization_score,
+               0 AS touches, 0 AS replies, 0 AS positive_replies,
+               0 AS replied_touches, 0 AS positive_touches, 1 AS meetings
+        FROM opportunities o
+        LEFT JOIN touchpoints t ON t.id = o.trigger_touchpoint_id
+        LEFT JOIN message_drafts md ON md.id = t.message_draft_id
+        LEFT JOIN contacts c ON c.id = o.contact_id
+        LEFT JOIN accounts a ON a.id = c.account_id
+        {where}
+    """,
+}
+
+# Row alias used in each source, for the single-row trigger filter
+_SOURCE_ALIASES = {"touchpoints": "t", "replies": "r", "opportunities": "o"}
+
+
+def _unpivot(dimensions: tuple) -> tuple:
+    """(VALUES list of dimension names, CASE picking e.<dimension> for each)."""
+    dims = ", ".join(f"('{d}')" for d in dimensions)
+    value = "CASE dims.column1 " + " ".join(
+        f"WHEN '{d}' THEN e.{d}" for d in dimensions
+    ) + " END"
+    return dims, f"COALESCE(CAST({value} AS TEXT), '')"
+
+
+def _bucket_select(source: str, where: str) -> str:
+    """Unpivot a source into (dimension, day, value, measures...) bucket rows."""
+    dims, value = _unpivot(DIMENSIONS)
+    sums = ", ".join(f"SUM(e.{m}) AS {m}" for m in MEASURES)
+    return f"""
+        SELECT dims.column1 AS dimension, e.day AS day, {value} AS value, {sums}
+        FROM ({_SOURCES[source].format(where=where)}) e, (VALUES {dims}) dims
+        WHERE true
+        GROUP BY 1, 2, 3
+    """
+
+
+def _upsert_sql(source: str, where: str = "") -> str:
+    """INSERT the source's buckets into analytics_rollups, adding to existing counts."""
+    columns = ", ".join(MEASURES)
+    updates = ", ".join(f"{m} = {m} + excluded.{m}" for m in MEASURES)
+    return (
+        f"INSERT INTO analytics_rollups (dimension, day, value, {columns}) "
+        f"{_bucket_select(source, where)} "
+        f"ON CONFLICT (dimension, day, value) DO UPDATE SET {updates}"
+    )
+
+
+# ─── ROLLUP MAINTENANCE ─────────────────────────────────────────
+
+def install_analytics_rollups(conn: sqlite3.Connection):
+    """Create analytics_rollups, its insert triggers, and backfill it.
+
+    Idempotent. The caller commits.
+    """
+    measures = ",\n            ".join(f"{m} INTEGER NOT NULL DEFAULT 0" for m in MEASURES)
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS analytics_rollups (
+            dimension TEXT NOT NULL,
+            day TEXT NOT NULL,
+            value TEXT NOT NULL,
+            {measures},
+            PRIMARY KEY (dimension, day, value)
+        ) WITHOUT ROWID
+    """)
+    # The first-reply checks in the replies source look up earlier replies per touchpoint
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_replies_touchpoint ON replies(touchpoint_id)")
+    for table, alias in _SOURCE_ALIASES.items():
+        conn.execute(
+            f"""CREATE TRIGGER IF NOT EXISTS trg_rollup_{table}_ins AFTER INSERT ON {table}
+                BEGIN {_upsert_sql(table, f"WHERE {alias}.rowid = NEW.rowid")}; END"""
+        )
+    rebuild_analytics_rollups(conn)
+
+
+def rebuild_analytics_rollups(conn: sqlite3.Connection):
+    """Recompute every bucket from the source tables. The caller commits."""
+    conn.execute("DELETE FROM analytics_rollups")
+    for table in _SOURCES:
+        conn.execute(_upsert_sql(table))
+
+
+def drop_analytics_rollups(conn: sqlite3.Connection):
+    """Remove the rollup triggers and table. The caller commits."""
+    for table in _SOURCES:
+        conn.execute(f"DROP TRIGGER IF EXISTS trg_rollup_{table}_ins")
+    conn.execute("DROP TABLE IF EXISTS analytics_rollups")
+
+
+# ─── READ PATH ──────────────────────────────────────────────────
+
+def rollup_breakdown(conn: sqlite3.Connection, dimension: str, since: str = None) -> list:
+    """Sum each measure per value of one dimension.
+
+    Args:
+        dimension: One of DIMENSIONS.
+        since: Optional ISO date (YYYY-MM-DD); only buckets on or after it count.
+
+    Returns:
+        List of {"value": str, <measure>: int, ...} dicts ordered by value.
+        Events with no value for the dimension have value ''.
+    """
+    return rollup_breakdowns(conn, (dimension,), since)[dimension]
+
+
+def rollup_breakdowns(conn: sqlite3.Connection, dimensions: tuple, since: str = None) -> dict:
+    """rollup_breakdown() for several dimensions in one query.
+
+    Without the rollup table this is a single live pass over each source
+    table that fills every requested dimension at once.
+
+    Returns:
+        {dimension: [{"value": str, <measure>: int, ...}, ...]} for each dimension.
+    """
+    unknown = [d for d in dimensions if d not in DIMENSIONS]
+    if unknown:
+        raise ValueError(f"Unknown rollup dimension: {unknown[0]}")
+
+    sums = ", ".join(f"SUM({m}) AS {m}" for m in MEASURES)
+    dim_filter = "dimension IN (" + ", ".join("?" for _ in dimensions) + ")"
+    day_filter = " AND day >= ?" if since else ""
+    params = list(dimensions) + ([since] if since else [])
+    tail = (f"WHERE {dim_filter}{day_filter} "
+            f"GROUP BY dimension, value ORDER BY dimension, value")
+    try:
+        cur = conn.execute(f"SELECT dimension, value, {sums} FROM analytics_rollups {tail}", params)
+    except sqlite3.OperationalError:
+        # Not installed: aggregate live. Group the events by every requested
+        # dimension in one pass, then unpivot the (much smaller) grouped rows.
+        events = " UNION ALL ".join(src.format(where="") for src in _SOURCES.values())
+        dims, value = _unpivot(tuple(dimensions))
+        group_cols = ", ".join(dimensions)
+        cur = conn.execute(f"""
+            WITH e AS (
+                SELECT {group_cols}, {", ".join(f"SUM({m}) AS {m}" for m in MEASURES)}
+                FROM ({events})
+                WHERE {"day >= ?" if since else "true"}
+                GROUP BY {group_cols}
+            )
+            SELECT dims.column1 AS dimension, {value} AS value, {sums}
+            FROM e, (VALUES {dims}) dims
+            WHERE true
+            GROUP BY 1, 2 ORDER BY 1, 2
+        """, [since] if since else [])
+
+    columns = [d[0] for d in cur.description][1:]
+    result = {d: [] for d in dimensions}
+    for row in cur.fetchall():
+        result[row[0]].append(dict(zip(columns, row[1:])))
+    return result
@@ -0,0 +1,156 @@
+"""
+Dashboard stats engine.
+
+Computes the home-page counters in a single round trip: each table is scanned
+at most once, with conditional SUM(CASE ...) aggregates instead of one
+SELECT COUNT(*) per metric.
+
+Optionally the counters are maintained incrementally in a stats_counters table
+by triggers (installed by migration 004). When that table exists the dashboard
+reads the pre-computed values directly, so page loads stay O(1) regardless of
+how many touchpoints or replies have accumulated. Time-dependent metrics
+(pending_followups, which compares against datetime('now')) are always
+computed live from their index.
+"""
+
+import logging
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+
+# ─── COUNTER DEFINITIONS ────────────────────────────────────────
+# name -> (table, row predicate using {r} as the row alias, columns the predicate reads)
+# A counter equals SELECT COUNT(*) FROM table WHERE predicate.
+COUNTER_SPECS = {
+    "total_contacts": ("contacts", "{r}.status = 'active'", ("status",)),
+    "total_accounts": ("accounts", "1", ()),
+    "touches_sent": ("touchpoints", "1", ()),
+    "total_replies": ("replies", "1", ()),
+    "positive_replies": ("replies", "{r}.intent = 'positive'", ("intent",)),
+    "meetings_booked": (
+        "opportunities",
+        "{r}.status IN ('meeting_booked','meeting_held','opportunity_created')",
+        ("status",),
+    ),
+    "opportunities_created": ("opportunities", "{r}.opportunity_created = 1", ("opportunity_created",)),
+    "active_batches": ("batches", "{r}.status IN ('building','active')", ("status",)),
+}
+
+PENDING_FOLLOWUPS_SQL = (
+    "SELECT COUNT(*) FROM followups WHERE state='pending' AND due_date<=datetime('now')"
+)
+
+# One row, one statement: every table is scanned once and its metrics are
+# folded into conditional aggregates.
+DASHBOARD_COUNTS_SQL = """
+    SELECT * FROM
+        (SELECT COUNT(*) AS total_contacts FROM contacts WHERE status = 'active'),
+        (SELECT COUNT(*) AS total_accounts FROM accounts),
+        (SELECT COUNT(*) AS touches_sent FROM touchpoints),
+        (SELECT COUNT(*) AS total_replies,
+                COALESCE(SUM(CASE WHEN intent = 'positive' THEN 1 ELSE 0 END), 0) AS positive_replies
+         FROM replies),
+        (SELECT COALESCE(SUM(CASE WHEN status IN ('meeting_booked','meeting_held','opportunity_created')
+                                  THEN 1 ELSE 0 END), 0) AS meetings_booked,
+                COALESCE(SUM(CASE WHEN opportunity_created = 1 THEN 1 ELSE 0 END), 0) AS opportunities_created
+         FROM opportunities),
+        (SELECT COUNT(*) AS pending_followups FROM followups
+         WHERE state = 'pending' AND due_date <= datetime('now')),
+        (SELECT COUNT(*) AS active_batches FROM batches WHERE status IN ('building','active'))
+"""
+
+
+def _flag(predicate: str, alias: str) -> str:
+    """SQL expression that is 1 when the predicate holds for the row alias, else 0."""
+    return f"(CASE WHEN {predicate.format(r=alias)} THEN 1 ELSE 0 END)"
+
+
+def _counter_triggers(name: str, table: str, predicate: str, columns: tuple) -> list:
+    """Build the INSERT/DELETE/UPDATE trigger statements for one counter."""
+    update = "UPDATE stats_counters SET value = value + {delta} WHERE name = '" + name + "';"
+    triggers = [
+        f"""CREATE TRIGGER IF NOT EXISTS trg_stats_{name}_ins AFTER INSERT ON {table}
+            BEGIN {update.format(delta=_flag(predicate, 'NEW'))} END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_stats_{name}_del AFTER DELETE ON {table}
+            BEGIN {update.format(delta='-' + _flag(predicate, 'OLD'))} END""",
+    ]
+    if columns:
+        delta = f"{_flag(predicate, 'NEW')} - {_flag(predicate, 'OLD')}"
+        triggers.append(
+            f"""CREATE TRIGGER IF NOT EXISTS trg_stats_{name}_upd AFTER UPDATE OF {', '.join(columns)} ON {table}
+                BEGIN {update.format(delta=delta)} END"""
+        )
+    return triggers
+
+
+# ─── COUNTER MAINTENANCE ────────────────────────────────────────
+
+def install_stats_counters(conn: sqlite3.Connection):
+    """Create stats_counters, its triggers, and backfill current values.
+
+    Idempotent. The caller commits.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS stats_counters (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    for name, (table, predicate, columns) in COUNTER_SPECS.items():
+        for stmt in _counter_triggers(name, table, predicate, columns):
+            conn.execute(stmt)
+    rebuild_stats_counters(conn)
+
+
+def rebuild_stats_counters(conn: sqlite3.Connection):
+    """Recompute every counter from its source table. The caller commits."""
+    counts = _aggregate_counts(conn)
+    conn.executemany(
+        "INSERT INTO stats_counters (name, value) VALUES (?, ?) "
+        "ON CONFLICT(name) DO UPDATE SET value = excluded.value",
+        [(name, counts[name]) for name in COUNTER_SPECS],
+    )
+
+
+def drop_stats_counters(conn: sqlite3.Connection):
+    """Remove the counter triggers and table. The caller commits."""
+    for name in COUNTER_SPECS:
+        for suffix in ("ins", "del", "upd"):
+            conn.execute(f"DROP TRIGGER IF EXISTS trg_stats_{name}_{suffix}")
+    conn.execute("DROP TABLE IF EXISTS stats_counters")
+
+
+# ─── READ PATH ──────────────────────────────────────────────────
+
+def _aggregate_counts(conn: sqlite3.Connection) -> dict:
+    """Compute every dashboard counter with the single-pass aggregate query."""
+    cur = conn.execute(DASHBOARD_COUNTS_SQL)
+    columns = [d[0] for d in cur.description]
+    return dict(zip(columns, cur.fetchone()))
+
+
+def _read_counters(conn: sqlite3.Connection) -> dict:
+    """Return maintained counters, or None if stats_counters is not installed."""
+    try:
+        rows = conn.execute("SELECT name, value FROM stats_counters").fetchall()
+    except sqlite3.OperationalError:
+        return None
+    counts = {r[0]: r[1] for r in rows}
+    if not all(name in counts for name in COUNTER_SPECS):
+        return None
+    return counts
+
+
+def dashboard_counts(conn: sqlite3.Connection) -> dict:
+    """Return the raw dashboard counters.
+
+    Uses trigger-maintained stats_counters when installed, otherwise the
+    single-pass aggregate query.
+    """
+    counts = _read_counters(conn)
+    if counts is not None:
+        counts = {name: counts[name] for name in COUNTER_SPECS}
+        counts["pending_followups"] = conn.execute(PENDING_FOLLOWUPS_SQL).fetchone()[0]
+        return counts
+    return _aggregate_counts(conn)
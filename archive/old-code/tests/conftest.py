@@ -20,6 +20,7 @@ def test_db(tmp_path):
 
     # Reload models module to pick up new DB_PATH
     import src.db.models as models
+    previous_db_path = models.DB_PATH
     models.DB_PATH = db_path
 
     init_db(db_path)
@@ -28,6 +29,7 @@ def test_db(tmp_path):
 
     yield db_path
 
+    models.DB_PATH = previous_db_path
     os.environ.pop("OCC_DB_PATH", None)
     os.environ.pop("OCC_JOURNAL_MODE", None)
 
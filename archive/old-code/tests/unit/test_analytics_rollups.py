@@ -0,0 +1,154 @@
+"""Tests for the trigger-maintained analytics rollups and the readers built on them."""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+import src.db.models as models
+from src.agents.analytics import get_reply_rates_by_persona
+from src.agents.feedback_tracker import get_conversion_stats
+from src.db.init_db import init_db
+from src.db.migration_runner import run_migrations
+from src.db.rollups import (
+    DIMENSIONS, install_analytics_rollups, rebuild_analytics_rollups,
+    drop_analytics_rollups, rollup_breakdown, rollup_breakdowns,
+)
+
+
+def _breakdowns() -> dict:
+    conn = models.get_db()
+    result = {dim: rollup_breakdown(conn, dim) for dim in DIMENSIONS}
+    conn.close()
+    return result
+
+
+def _install():
+    conn = models.get_db()
+    install_analytics_rollups(conn)
+    conn.commit()
+    conn.close()
+
+
+def _populate(sample_account):
+    """Two contacts: A gets two touches (one replied twice) and a meeting; B one touch, no reply."""
+    contacts = models.create_contacts_many([
+        {"account_id": sample_account["id"], "first_name": "A", "last_name": "X", "persona_type": "qa_leader"},
+        {"account_id": sample_account["id"], "first_name": "B", "last_name": "X", "persona_type": "vp_eng"},
+    ])
+    drafts = models.create_messages_many([
+        {"contact_id": contacts[0]["id"], "channel": "linkedin", "touch_number": 1, "touch_type": "inmail",
+         "body": "b", "proof_point_used": "hansard", "opener_style": "career", "ab_group": "A",
+         "personalization_score": 3},
+        {"contact_id": contacts[1]["id"], "channel": "email", "touch_number": 1, "touch_type": "email",
+         "body": "b", "proof_point_used": "cred", "ab_group": "B", "personalization_score": 2},
+    ])
+    touches = models.log_touchpoints_many([
+        {"contact_id": contacts[0]["id"], "message_draft_id": drafts[0]["id"],
+         "channel": "linkedin", "touch_number": 1},
+        {"contact_id": contacts[0]["id"], "channel": "email", "touch_number": 2},
+        {"contact_id": contacts[1]["id"], "message_draft_id": drafts[1]["id"],
+         "channel": "email", "touch_number": 1},
+    ])
+    for intent in ("neutral", "positive"):
+        models.log_reply({"contact_id": contacts[0]["id"], "touchpoint_id": touches[0]["id"],
+                          "channel": "linkedin", "intent": intent})
+    models.create_opportunity({"contact_id": contacts[0]["id"], "trigger_touchpoint_id": touches[0]["id"]})
+    return contacts, touches
+
+
+def _row(rows: list, value: str) -> dict:
+    return next(r for r in rows if r["value"] == value)
+
+
+def test_rollups_incremental_match_rebuild_and_live(test_db, sample_account):
+    _install()
+    _populate(sample_account)
+    incremental = _breakdowns()
+
+    by_pp = _row(incremental["proof_point"], "hansard")
+    assert (by_pp["touches"], by_pp["replies"], by_pp["positive_replies"]) == (1, 2, 1)
+    # Two replies on one touchpoint still count it as a single replied touch
+    assert (by_pp["replied_touches"], by_pp["positive_touches"], by_pp["meetings"]) == (1, 1, 1)
+    assert _row(incremental["persona"], "qa_leader")["touches"] == 2
+    assert _row(incremental["proof_point"], "")["touches"] == 1
+    assert _row(incremental["personalization_score"], "2")["touches"] == 1
+
+    conn = models.get_db()
+    rebuild_analytics_rollups(conn)
+    conn.commit()
+    conn.close()
+    assert _breakdowns() == incremental
+
+    conn = models.get_db()
+    drop_analytics_rollups(conn)
+    conn.commit()
+    conn.close()
+    assert _breakdowns() == incremental
+
+
+def test_rollup_breakdown_day_window_and_unknown_dimension(test_db, sample_account):
+    contacts = models.create_contacts_many([
+        {"account_id": sample_account["id"], "first_name": "A", "last_name": "X"},
+    ])
+    old = (datetime.utcnow() - timedelta(days=10)).isoformat()
+    models.log_touchpoints_many([
+        {"contact_id": contacts[0]["id"], "channel": "linkedin", "touch_number": 1, "sent_at": old},
+        {"contact_id": contacts[0]["id"], "channel": "linkedin", "touch_number": 2},
+    ])
+    since = (datetime.utcnow().date() - timedelta(days=2)).isoformat()
+
+    conn = models.get_db()
+    live = rollup_breakdowns(conn, ("channel", "touch_number"), since)
+    install_analytics_rollups(conn)
+    assert rollup_breakdowns(conn, ("channel", "touch_number"), since) == live
+    assert _row(rollup_breakdown(conn, "channel"), "linkedin")["touches"] == 2
+    assert _row(live["channel"], "linkedin")["touches"] == 1
+    assert [r["value"] for r in live["touch_number"]] == ["2"]
+    with pytest.raises(ValueError):
+        rollup_breakdown(conn, "tone")
+    conn.close()
+
+
+def test_conversion_stats_read_rollups(test_db, sample_account):
+    _populate(sample_account)
+    live = get_conversion_stats(days=7)
+    _install()
+    stats = get_conversion_stats(days=7)
+
+    assert stats == live
+    assert stats["totals"]["touches_sent"] == 3
+    assert stats["totals"]["replies_received"] == 2
+    assert stats["totals"]["meetings_booked"] == 1
+    assert stats["by_proof_point"]["hansard"]["replied"] == 1
+    assert stats["by_proof_point"]["(unknown)"]["sent"] == 1
+    assert stats["by_channel"]["email"]["sent"] == 2
+    assert stats["by_subject_style"]["(unknown)"]["sent"] == 3
+    assert get_conversion_stats(days=0)["totals"]["touches_sent"] == 0
+
+
+def test_reply_rates_by_persona_read_rollups(test_db, sample_account):
+    _install()
+    _populate(sample_account)
+
+    assert get_reply_rates_by_persona() == [
+        {"persona": "qa_leader", "total": 2, "replied": 1, "reply_rate": 0.5},
+        {"persona": "vp_eng", "total": 1, "replied": 0, "reply_rate": 0.0},
+    ]
+
+
+def test_rollups_installed_by_migration(tmp_path):
+    db_path = str(tmp_path / "rollups.db")
+    init_db(db_path)
+    result = run_migrations(db_path)
+    assert result["failed"] == 0
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO contacts (id, first_name, last_name, persona_type) VALUES ('con_1', 'A', 'B', 'cto')")
+    conn.execute("INSERT INTO touchpoints (id, contact_id, channel, sent_at) "
+                 "VALUES ('tp_1', 'con_1', 'email', '2026-01-05T10:00:00')")
+    conn.commit()
+    row = conn.execute("SELECT day, touches FROM analytics_rollups "
+                       "WHERE dimension='persona' AND value='cto'").fetchone()
+    conn.close()
+    assert row == ("2026-01-05", 1)
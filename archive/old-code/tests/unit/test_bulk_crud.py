@@ -0,0 +1,99 @@
+"""Tests for the bulk CRUD helpers in src.db.models and their pipeline callers."""
+
+import src.db.models as models
+from src.agents.batch_builder import BatchPipeline
+from src.agents.message_writer import store_generated_messages
+
+
+def test_create_contacts_many_returns_rows_in_order(test_db, sample_account):
+    items = [
+        {"account_id": sample_account["id"], "first_name": f"F{i}", "last_name": f"L{i}", "title": "QA Lead"}
+        for i in range(120)
+    ]
+    rows = models.create_contacts_many(items)
+
+    assert [r["first_name"] for r in rows] == [f"F{i}" for i in range(120)]
+    assert all(r["id"].startswith("con_") for r in rows)
+    assert rows[0]["stage"] == "new"
+    assert rows[0]["priority_factors"] == "{}"
+    assert models.get_contact(rows[-1]["id"])["company_name"] == "Test Corp"
+
+
+def test_create_contacts_many_empty(test_db):
+    assert models.create_contacts_many([]) == []
+
+
+def test_create_contacts_many_is_atomic(test_db, sample_account):
+    items = [
+        {"account_id": sample_account["id"], "first_name": "Ok", "last_name": "One"},
+        {"account_id": "acc_missing", "first_name": "Bad", "last_name": "Fk"},
+    ]
+    try:
+        models.create_contacts_many(items)
+        assert False, "Expected FK violation"
+    except Exception:
+        pass
+    assert models.list_contacts() == []
+
+
+def test_create_messages_many(test_db, sample_contact):
+    drafts = models.create_messages_many([
+        {"contact_id": sample_contact["id"], "channel": "linkedin", "touch_number": n,
+         "touch_type": "inmail", "body": f"Body {n}"}
+        for n in (1, 3, 6)
+    ])
+    assert [d["touch_number"] for d in drafts] == [1, 3, 6]
+    assert drafts[0]["approval_status"] == "draft"
+    assert len(models.get_messages_for_contact(sample_contact["id"])) == 3
+
+
+def test_log_touchpoints_many_updates_stage_from_last_touch(test_db, sample_contact):
+    tps = models.log_touchpoints_many([
+        {"contact_id": sample_contact["id"], "channel": "linkedin", "touch_number": 1},
+        {"contact_id": sample_contact["id"], "channel": "linkedin", "touch_number": 3},
+    ])
+    assert len(tps) == 2
+    assert tps[1]["touch_number"] == 3
+    assert models.get_contact(sample_contact["id"])["stage"] == "sequencing"
+
+
+def test_phase_extract_bulk(test_db):
+    models.create_account({"name": "Existing Co"})
+    pipeline = BatchPipeline(batch_number=1)
+    pipeline.initialize()
+
+    prospects = [
+        {"first_name": "A", "last_name": "One", "company": "existing co", "title": "QA Manager"},
+        {"first_name": "B", "last_name": "Two", "company": "NewCo", "vertical": "SaaS"},
+        {"first_name": "C", "last_name": "Three", "company": "newco"},
+        {"first_name": "D", "last_name": "Four"},
+    ]
+    for i, p in enumerate(prospects):
+        p["linkedin_url"] = f"https://linkedin.com/in/p{i}"
+    contact_ids = pipeline.phase_extract(prospects)
+    assert len(contact_ids) == 4
+
+    contacts = [models.get_contact(cid) for cid in contact_ids]
+    assert contacts[0]["company_name"] == "Existing Co"
+    assert contacts[1]["account_id"] == contacts[2]["account_id"]
+    assert contacts[1]["company_industry"] == "SaaS"
+    assert contacts[3]["company_name"] == "Unknown"
+
+    conn = models.get_db()
+    linked = conn.execute("SELECT COUNT(*) FROM batch_prospects WHERE batch_id=?",
+                          (pipeline.batch_id,)).fetchone()[0]
+    conn.close()
+    assert linked == 4
+
+
+def test_store_generated_messages_bulk(test_db, sample_contact):
+    generated = {
+        "touch_1_inmail": {"parsed": {"subject_line": "Hi", "body": "Hello there", "word_count": 2},
+                           "proof_point": {"short": "cred"}, "pain_hook": "flaky"},
+        "touch_2_call": {"parsed": {"opener": "o", "pain": "p", "bridge": "b"}},
+        "objection": {"objection": "We use Selenium", "response": "Sure"},
+    }
+    stored = store_generated_messages(sample_contact["id"], generated, ab_group="A")
+    assert [m["touch_type"] for m in stored] == ["inmail", "call_snippet"]
+    assert stored[0]["pain_hook"] == "flaky"
+    assert models.get_contact(sample_contact["id"])["predicted_objection"] == "We use Selenium"
@@ -0,0 +1,122 @@
+"""Tests for the single-pass dashboard stats engine and its trigger-maintained counters."""
+
+import sqlite3
+
+import src.db.models as models
+from src.db.init_db import init_db
+from src.db.migration_runner import run_migrations
+from src.db.stats import COUNTER_SPECS, install_stats_counters, drop_stats_counters
+
+
+def _naive_counts() -> dict:
+    """The pre-engine per-metric COUNT(*) queries, used as the reference."""
+    conn = models.get_db()
+    q = lambda sql: conn.execute(sql).fetchone()[0]
+    counts = {
+        "total_contacts": q("SELECT COUNT(*) FROM contacts WHERE status='active'"),
+        "total_accounts": q("SELECT COUNT(*) FROM accounts"),
+        "touches_sent": q("SELECT COUNT(*) FROM touchpoints"),
+        "total_replies": q("SELECT COUNT(*) FROM replies"),
+        "positive_replies": q("SELECT COUNT(*) FROM replies WHERE intent='positive'"),
+        "meetings_booked": q("SELECT COUNT(*) FROM opportunities WHERE status IN "
+                             "('meeting_booked','meeting_held','opportunity_created')"),
+        "opportunities_created": q("SELECT COUNT(*) FROM opportunities WHERE opportunity_created=1"),
+        "pending_followups": q("SELECT COUNT(*) FROM followups WHERE state='pending' "
+                               "AND due_date<=datetime('now')"),
+        "active_batches": q("SELECT COUNT(*) FROM batches WHERE status IN ('building','active')"),
+    }
+    conn.close()
+    return counts
+
+
+def _populate(sample_account):
+    contacts = models.create_contacts_many([
+        {"account_id": sample_account["id"], "first_name": f"C{i}", "last_name": "X"}
+        for i in range(4)
+    ])
+    models.update_contact(contacts[3]["id"], {"status": "archived"})
+    tps = models.log_touchpoints_many([
+        {"contact_id": c["id"], "channel": "linkedin", "touch_number": 1} for c in contacts
+    ])
+    models.log_reply({"contact_id": contacts[0]["id"], "touchpoint_id": tps[0]["id"],
+                      "channel": "linkedin", "intent": "positive"})
+    models.log_reply({"contact_id": contacts[1]["id"], "channel": "linkedin", "intent": "neutral"})
+    models.create_opportunity({"contact_id": contacts[0]["id"], "account_id": sample_account["id"]})
+    models.schedule_followup(contacts[1]["id"], 3, "email", days_from_now=-2)
+    models.create_batch({"batch_number": 1})
+    return contacts
+
+
+def _expected_stats(counts: dict) -> dict:
+    stats = dict(counts)
+    stats["reply_rate"] = round(counts["total_replies"] / counts["touches_sent"] * 100, 1) if counts["touches_sent"] else 0
+    stats["meeting_rate"] = round(counts["meetings_booked"] / counts["total_replies"] * 100, 1) if counts["total_replies"] else 0
+    return stats
+
+
+def test_dashboard_stats_empty_db(test_db):
+    stats = models.get_dashboard_stats()
+    assert stats == _expected_stats(_naive_counts())
+    assert stats["reply_rate"] == 0
+    assert stats["meeting_rate"] == 0
+
+
+def test_dashboard_stats_single_pass_matches_count_queries(test_db, sample_account):
+    _populate(sample_account)
+    stats = models.get_dashboard_stats()
+
+    assert stats == _expected_stats(_naive_counts())
+    assert stats["total_contacts"] == 3
+    assert stats["positive_replies"] == 1
+    assert stats["pending_followups"] == 1
+
+
+def test_stats_counters_backfill_and_triggers(test_db, sample_account):
+    contacts = _populate(sample_account)
+
+    conn = models.get_db()
+    install_stats_counters(conn)
+    conn.commit()
+    conn.close()
+    assert models.get_dashboard_stats() == _expected_stats(_naive_counts())
+
+    # Inserts, status transitions and deletes keep the counters exact
+    models.update_contact(contacts[3]["id"], {"status": "active"})
+    models.update_contact(contacts[0]["id"], {"status": "archived"})
+    models.log_reply({"contact_id": contacts[2]["id"], "channel": "email", "intent": "positive"})
+    opp = models.create_opportunity({"contact_id": contacts[1]["id"], "account_id": sample_account["id"]})
+    conn = models.get_db()
+    conn.execute("UPDATE opportunities SET status='closed_lost', opportunity_created=1 WHERE id=?",
+                 (opp["id"],))
+    conn.execute("UPDATE replies SET intent='negative' WHERE intent='neutral'")
+    conn.execute("UPDATE batches SET status='complete'")
+    conn.execute("DELETE FROM replies WHERE channel='email'")
+    conn.commit()
+    conn.close()
+
+    stats = models.get_dashboard_stats()
+    assert stats == _expected_stats(_naive_counts())
+    assert stats["active_batches"] == 0
+    assert stats["opportunities_created"] == 1
+
+    conn = models.get_db()
+    counters = {r[0]: r[1] for r in conn.execute("SELECT name, value FROM stats_counters")}
+    drop_stats_counters(conn)
+    conn.commit()
+    conn.close()
+    assert set(counters) == set(COUNTER_SPECS)
+    assert models.get_dashboard_stats() == stats
+
+
+def test_stats_counters_installed_by_migration(tmp_path):
+    db_path = str(tmp_path / "stats.db")
+    init_db(db_path)
+    result = run_migrations(db_path)
+    assert result["failed"] == 0
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO accounts (id, name) VALUES ('acc_1', 'A')")
+    conn.commit()
+    value = conn.execute("SELECT value FROM stats_counters WHERE name='total_accounts'").fetchone()[0]
+    conn.close()
+    assert value == 1
@@ -0,0 +1,115 @@
+"""Tests for the thread-affine SQLite connection pool in src.db.connection."""
+
+import os
+import threading
+
+from src.db.connection import ConnectionPool, PooledConnection
+import src.db.models as models
+
+
+def test_get_db_reuses_connection_on_same_thread(test_db):
+    conn1 = models.get_db()
+    raw1 = conn1.raw
+    conn1.close()
+
+    conn2 = models.get_db()
+    assert isinstance(conn2, PooledConnection)
+    assert conn2.raw is raw1
+    conn2.close()
+
+
+def test_pragmas_applied_once(test_db):
+    conn = models.get_db()
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    conn.close()
+
+
+def test_nested_checkout_shares_connection(test_db, sample_contact):
+    outer = models.get_db()
+    inner = models.get_db()
+    assert inner.raw is outer.raw
+    inner.close()
+    # Outer checkout still usable after the nested one is released
+    row = outer.execute("SELECT id FROM contacts WHERE id=?", (sample_contact["id"],)).fetchone()
+    assert row["id"] == sample_contact["id"]
+    outer.close()
+
+
+def test_release_rolls_back_uncommitted_work(test_db, sample_account):
+    conn = models.get_db()
+    conn.execute("UPDATE accounts SET name='Uncommitted' WHERE id=?", (sample_account["id"],))
+    conn.close()
+
+    assert models.get_account(sample_account["id"])["name"] == "Test Corp"
+
+
+def test_row_factory_reset_on_release(test_db):
+    conn = models.get_db()
+    conn.row_factory = None
+    conn.close()
+
+    conn = models.get_db()
+    row = conn.execute("SELECT 1 AS one").fetchone()
+    assert row["one"] == 1
+    conn.close()
+
+
+def test_threads_get_separate_connections(test_db):
+    main_conn = models.get_db()
+    main_raw = main_conn.raw
+    main_conn.close()
+
+    seen = {}
+
+    def worker():
+        conn = models.get_db()
+        seen["raw"] = conn.raw
+        seen["count"] = conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+        conn.close()
+
+    t = threading.Thread(target=worker)
+    t.start()
+    t.join()
+
+    assert seen["raw"] is not main_raw
+    assert seen["count"] == 0
+
+
+def test_recreated_db_file_gets_fresh_connection(tmp_path):
+    pool = ConnectionPool()
+    db_path = str(tmp_path / "pool.db")
+
+    conn = pool.acquire(db_path)
+    conn.execute("CREATE TABLE t (x INTEGER)")
+    conn.commit()
+    conn.close()
+
+    os.remove(db_path)
+
+    conn = pool.acquire(db_path)
+    tables = conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+    conn.close()
+    assert tables == []
+    pool.close_all()
+
+
+def test_disabled_pool_returns_plain_connections(tmp_path):
+    pool = ConnectionPool(enabled=False)
+    conn = pool.acquire(str(tmp_path / "plain.db"))
+    assert not isinstance(conn, PooledConnection)
+    conn.close()
+    assert pool.stats()["opened"] == 1
+
+
+def test_crud_round_trip_through_pool(test_db, sample_account):
+    contact = models.create_contact({
+        "account_id": sample_account["id"],
+        "first_name": "Pool",
+        "last_name": "Test",
+        "title": "QA Lead",
+    })
+    updated = models.update_contact(contact["id"], {"stage": "touched"})
+    assert updated["stage"] == "touched"
+    assert models.get_contact(contact["id"])["company_name"] == "Test Corp"
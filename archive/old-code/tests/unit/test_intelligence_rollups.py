@@ -0,0 +1,56 @@
+"""Tests for the pre-aggregated rollups behind models.get_intelligence_data."""
+
+import src.db.models as models
+
+
+def _seed(sample_account):
+    """Two contacts with several touches and replies each, so a naive join would fan out."""
+    other = models.create_account({"name": "Other Co", "industry": "FinTech"})
+    models.update_account(sample_account["id"], {"industry": "SaaS"})
+    contacts = models.create_contacts_many([
+        {"account_id": sample_account["id"], "first_name": "A", "last_name": "One", "persona_type": "qa_leader"},
+        {"account_id": other["id"], "first_name": "B", "last_name": "Two", "persona_type": "qa_leader"},
+        {"account_id": other["id"], "first_name": "C", "last_name": "Three", "persona_type": "vp_eng"},
+    ])
+    drafts = models.create_messages_many([
+        {"contact_id": c["id"], "channel": "linkedin", "touch_number": 1, "touch_type": "inmail",
+         "body": "b", "proof_point_used": pp, "personalization_score": score}
+        for c, pp, score in zip(contacts, ["hansard", "hansard", "cred"], [3, 2, 3])
+    ])
+    touches = models.log_touchpoints_many(
+        [{"contact_id": contacts[0]["id"], "message_draft_id": drafts[0]["id"],
+          "channel": "linkedin", "touch_number": n} for n in range(1, 5)]
+        + [{"contact_id": contacts[1]["id"], "message_draft_id": drafts[1]["id"],
+            "channel": "linkedin", "touch_number": n} for n in range(1, 3)]
+    )
+    # Contact A: 3 replies (two on the same touchpoint); contact B: 1 reply
+    for tp in (touches[0], touches[0], touches[1], touches[4]):
+        models.log_reply({"contact_id": tp["contact_id"], "touchpoint_id": tp["id"], "channel": "linkedin"})
+
+
+def test_intelligence_counts_do_not_fan_out(test_db, sample_account):
+    _seed(sample_account)
+    intel = models.get_intelligence_data()
+
+    assert intel["by_persona"] == [
+        {"persona": "qa_leader", "touches": 6, "replies": 4, "rate": 66.7},
+        {"persona": "vp_eng", "touches": 0, "replies": 0, "rate": 0.0},
+    ]
+    assert intel["by_vertical"] == [
+        {"vertical": "FinTech", "touches": 2, "replies": 1, "rate": 50.0},
+        {"vertical": "SaaS", "touches": 4, "replies": 3, "rate": 75.0},
+    ]
+    assert intel["by_proof_point"] == [
+        {"proof_point": "cred", "touches": 0, "replies": 0, "rate": 0.0},
+        {"proof_point": "hansard", "touches": 6, "replies": 4, "rate": 66.7},
+    ]
+    assert intel["by_personalization"] == [
+        {"score": 2, "touches": 2, "replies": 1, "rate": 50.0},
+        {"score": 3, "touches": 4, "replies": 3, "rate": 75.0},
+    ]
+
+
+def test_intelligence_empty_db(test_db):
+    assert models.get_intelligence_data() == {
+        "by_persona": [], "by_vertical": [], "by_proof_point": [], "by_personalization": [],
+    }
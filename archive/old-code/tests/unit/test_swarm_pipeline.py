@@ -0,0 +1,117 @@
+"""Tests for the per-contact pipelined executor in SwarmSupervisor."""
+
+import time
+
+import src.db.models as models
+from src.agents.swarm_supervisor import SwarmSupervisor, STAGES
+
+
+def _stub_stages(supervisor, delays: dict, qa_fails=()):
+    """Replace the agent tasks with sleeps (delays[(stage, cid)]) that record their timing."""
+    spans = {}
+
+    def make(stage):
+        def task(cid, token=None):
+            start = time.perf_counter()
+            time.sleep(delays.get((stage, cid), 0))
+            spans[(stage, cid)] = (start, time.perf_counter())
+            if stage == "qa":
+                return {"status": "completed", "passed": cid not in qa_fails}
+            return {"status": "completed"}
+        return task
+
+    for stage in STAGES:
+        setattr(supervisor, f"_{stage}_task", make(stage))
+    return spans
+
+
+def _contacts(account, n):
+    return [c["id"] for c in models.create_contacts_many([
+        {"account_id": account["id"], "first_name": f"C{i}", "last_name": "X"} for i in range(n)
+    ])]
+
+
+def test_contacts_flow_through_stages_without_barriers(test_db, sample_account):
+    slow, fast = _contacts(sample_account, 2)
+    supervisor = SwarmSupervisor({"max_workers": 2})
+    spans = _stub_stages(supervisor, {("research", slow): 0.3})
+
+    result = supervisor.run_batch([slow, fast])
+
+    assert all(result["phases"][stage][cid]["status"] == "completed"
+               for stage in STAGES for cid in (slow, fast))
+    # The fast contact finished its whole pipeline while the slow one was still researching
+    assert spans[("sequence", fast)][1] < spans[("research", slow)][1]
+    run = models.get_swarm_run(result["run_id"])
+    assert run["status"] == "completed"
+    assert run["completed_tasks"] == 8
+
+
+def test_gates_and_dedupe_are_preserved(test_db, sample_account):
+    passes, fails = _contacts(sample_account, 2)
+    events = []
+    supervisor = SwarmSupervisor()
+    supervisor.on_progress(lambda event, data: events.append((event, data.get("phase"))))
+    _stub_stages(supervisor, {}, qa_fails={fails})
+
+    result = supervisor.run_batch([passes, fails])
+    assert set(result["phases"]["sequence"]) == {passes}
+
+    # Dedupe keys are per agent/stage/contact, so a second run skips everything at research
+    rerun = SwarmSupervisor()
+    _stub_stages(rerun, {})
+    second = rerun.run_batch([passes])
+    assert second["phases"]["research"][passes] == {"status": "skipped", "reason": "duplicate"}
+    assert second["phases"]["draft"] == {}
+
+    assert [e for e in events if e[0] == "phase_completed"] == [("phase_completed", s) for s in STAGES]
+
+
+def test_feature_flag_disables_swarm(test_db, sample_account):
+    models.set_feature_flag("agent_swarm", False)
+    assert SwarmSupervisor().run_batch(_contacts(sample_account, 1)) == {
+        "error": "Agent swarm is disabled via feature flag"
+    }
+
+
+def test_hung_task_times_out_without_blocking_others(test_db, sample_account):
+    hung, *others = _contacts(sample_account, 3)
+    supervisor = SwarmSupervisor({"max_workers": 1, "task_timeout_seconds": 0.2,
+                                  "watchdog_interval_seconds": 0.05})
+    _stub_stages(supervisor, {("research", hung): 5})
+
+    start = time.perf_counter()
+    result = supervisor.run_batch([hung] + others)
+    assert time.perf_counter() - start < 2
+
+    assert result["phases"]["research"][hung]["status"] == "timeout"
+    assert hung not in result["phases"]["draft"]
+    assert all(result["phases"]["sequence"][cid]["status"] == "completed" for cid in others)
+
+    conn = models.get_db()
+    rows = conn.execute("SELECT status, error_message FROM swarm_tasks WHERE contact_id=? "
+                        "AND task_type='research'", (hung,)).fetchall()
+    conn.close()
+    assert [r["status"] for r in rows] == ["timeout"]
+    assert "Timed out" in rows[0]["error_message"]
+    assert models.get_swarm_run(result["run_id"])["failed_tasks"] == 1
+
+
+def test_cancel_signals_running_tasks(test_db, sample_account):
+    running, queued = _contacts(sample_account, 2)
+    supervisor = SwarmSupervisor({"max_workers": 1})
+    _stub_stages(supervisor, {})
+
+    def research(cid, token=None):
+        supervisor.cancel()
+        while True:  # Cooperative: only the token check gets us out
+            token.check()
+            time.sleep(0.01)
+
+    supervisor._research_task = research
+    result = supervisor.run_batch([running, queued])
+
+    assert result["phases"]["research"][running]["status"] == "cancelled"
+    assert result["phases"]["research"][queued]["status"] == "cancelled"
+    assert result["phases"]["draft"] == {}
+    assert models.get_swarm_run(result["run_id"])["status"] == "cancelled"